@@ -6,14 +6,44 @@ Creates standalone executables for different platforms
 
 import os
 import sys
+import shutil
 import subprocess
 import platform
+import functools
+
+# PyInstaller release installed when it is missing, and the local wheel cache
+# reused across virtual environments and CI runs
+PYINSTALLER_VERSION = "6.10.0"
+PIP_CACHE_DIR = ".pip-cache"
+
+@functools.lru_cache(maxsize=None)
+def _current_os():
+    """Return platform.system(), looked up once per run"""
+    return platform.system()
+
+@functools.lru_cache(maxsize=None)
+def _venv_python():
+    """
+    Return the Python interpreter to build with.
+    
+    Prefers the project's .venv interpreter and falls back to the one on
+    PATH. The result is cached so main() and build_app() always agree.
+    """
+    if _current_os() == "Windows":
+        python_cmd = os.path.join(".venv", "Scripts", "python.exe")
+        if not os.path.exists(python_cmd):
+            python_cmd = "python"
+    else:
+        python_cmd = os.path.join(".venv", "bin", "python")
+        if not os.path.exists(python_cmd):
+            python_cmd = "python3"
+    return python_cmd
 
-def run_command(command, description):
-    """Run a command and handle errors"""
+def run_command(command, description, env=None):
+    """Run a command (given as an argument list) and handle errors"""
     print(f"🔨 {description}...")
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
+        result = subprocess.run(command, check=True, capture_output=True, text=True, env=env)
         print(f"✅ {description} completed successfully!")
         return True
     except subprocess.CalledProcessError as e:
@@ -22,28 +52,22 @@ def run_command(command, description):
         print(f"Output: {e.stdout}")
         print(f"Error output: {e.stderr}")
         return False
+    except FileNotFoundError as e:
+        print(f"❌ {description} failed!")
+        print(f"Error: {e}")
+        return False
 
 def build_app():
     """Build the application for the current platform"""
     
     # Get the virtual environment Python path
-    if platform.system() == "Windows":
-        python_cmd = os.path.join(".venv", "Scripts", "python.exe")
-        if not os.path.exists(python_cmd):
-            python_cmd = "python"
-    else:
-        python_cmd = os.path.join(".venv", "bin", "python")
-        if not os.path.exists(python_cmd):
-            python_cmd = "python3"
+    python_cmd = _venv_python()
     
     # Clean previous builds
     print("🧹 Cleaning previous builds...")
     for folder in ["build", "dist", "__pycache__"]:
         if os.path.exists(folder):
-            if platform.system() == "Windows":
-                os.system(f'rmdir /s /q "{folder}" 2>nul')
-            else:
-                os.system(f'rm -rf "{folder}"')
+            shutil.rmtree(folder, ignore_errors=True)
     
     # Remove spec files
     for spec_file in ["PASS-FAIL-Hash-Verifier.spec"]:
@@ -53,37 +77,28 @@ def build_app():
     print("✅ Cleanup completed!")
     
     # Build command based on platform
-    current_os = platform.system()
+    current_os = _current_os()
     
     if current_os == "Darwin":  # macOS
         # Create app icon from image02.png with macOS rounded corners
         print("🎨 Creating macOS-style app icon from image02.png...")
         if os.path.exists("src/images/image02.png"):
             # Use the standalone rounded icon creator script
-            run_command(f'{python_cmd} create_macos_icon.py src/images/image02.png', "Creating rounded macOS icon")
+            run_command([python_cmd, "create_macos_icon.py", "src/images/image02.png"], "Creating rounded macOS icon")
         
         # First create a spec file for better dependency handling
         print("🔧 Creating optimized spec file...")
         spec_content = '''# -*- mode: python ; coding: utf-8 -*-
 
-from PyInstaller.utils.hooks import collect_all
-
-# Collect all data and imports from problematic modules
-datas = []
-binaries = []
-hiddenimports = []
+import os
+import sys
 
-# PIL/Pillow support
-tmp_ret = collect_all('PIL')
-datas += tmp_ret[0]
-binaries += tmp_ret[1]
-hiddenimports += tmp_ret[2]
+# Shared, cached collect_all() results (see scripts/pass_fail_hooks.py)
+sys.path.insert(0, os.path.join(SPECPATH, 'scripts'))
+from pass_fail_hooks import load_cached_collect
 
-# tkinterdnd2 support
-tmp_ret = collect_all('tkinterdnd2')
-datas += tmp_ret[0] 
-binaries += tmp_ret[1]
-hiddenimports += tmp_ret[2]
+# Collect all data and imports for PIL/Pillow and tkinterdnd2
+datas, binaries, hiddenimports = load_cached_collect(['PIL', 'tkinterdnd2'])
 
 # Add explicit hidden imports that PyInstaller might miss
 hiddenimports += [
@@ -95,18 +110,28 @@ hiddenimports += [
 # Add our data files
 datas += [('src/images', 'images'), ('src/wordlists', 'wordlists')]
 
+# Standard library packages the app never imports (test suites, packaging
+# and developer tools), left out to shrink the archive and speed up Analysis
+excludes = [
+    'test', 'tkinter.test', 'unittest', 'doctest', 'pydoc', 'pydoc_data',
+    'lib2to3', 'distutils', 'setuptools', 'pkg_resources', 'ensurepip', 'venv',
+    'idlelib', 'turtle', 'turtledemo', 'xmlrpc',
+]
+
 a = Analysis(['src/main.py'], pathex=[], binaries=binaries, datas=datas,
              hiddenimports=hiddenimports, hookspath=[], hooksconfig={},
-             runtime_hooks=[], excludes=[], noarchive=False, optimize=0)
+             runtime_hooks=[], excludes=excludes, noarchive=False, optimize=2)
 
 pyz = PYZ(a.pure, a.zipped_data, cipher=None)
 
+# UPX is disabled on macOS: it cannot usefully compress the Mach-O binaries
+# in an .app bundle and breaks their code signatures
 exe = EXE(pyz, a.scripts, [], exclude_binaries=True, name='PASS-FAIL-Hash-Verifier',
-          debug=False, bootloader_ignore_signals=False, strip=False, upx=True,
+          debug=False, bootloader_ignore_signals=False, strip=False, upx=False,
           console=False, disable_windowed_traceback=False, argv_emulation=False,
           target_arch=None, codesign_identity=None, entitlements_file=None)
 
-coll = COLLECT(exe, a.binaries, a.datas, strip=False, upx=True, upx_exclude=[], name='PASS-FAIL-Hash-Verifier')
+coll = COLLECT(exe, a.binaries, a.datas, strip=False, upx=False, upx_exclude=[], name='PASS-FAIL-Hash-Verifier')
 
 app = BUNDLE(coll, name='PASS-FAIL-Hash-Verifier.app', icon='icons/app_icon.icns',
              bundle_identifier='com.yourname.pass-fail-hash-verifier',
@@ -115,15 +140,23 @@ app = BUNDLE(coll, name='PASS-FAIL-Hash-Verifier.app', icon='icons/app_icon.icns
         with open("PASS-FAIL-Hash-Verifier.spec", "w") as f:
             f.write(spec_content)
         
-        cmd = f'{python_cmd} -m PyInstaller --noconfirm PASS-FAIL-Hash-Verifier.spec'
+        cmd = [python_cmd, "-m", "PyInstaller", "--noconfirm", "PASS-FAIL-Hash-Verifier.spec"]
         build_type = "macOS App Bundle (.app)"
         
     elif current_os == "Windows":  # Windows
-        cmd = f'{python_cmd} -m PyInstaller --onefile --windowed --add-data "src/images;images" --add-data "src/wordlists;wordlists" --name "PASS-FAIL-Hash-Verifier" --clean --noconfirm src/main.py'
+        cmd = [
+            python_cmd, "-m", "PyInstaller", "--onefile", "--windowed",
+            "--add-data", "src/images;images", "--add-data", "src/wordlists;wordlists",
+            "--name", "PASS-FAIL-Hash-Verifier", "--clean", "--noconfirm", "src/main.py",
+        ]
         build_type = "Windows Executable (.exe)"
         
     elif current_os == "Linux":  # Linux
-        cmd = f'{python_cmd} -m PyInstaller --onefile --add-data "src/images:images" --add-data "src/wordlists:wordlists" --name "PASS-FAIL-Hash-Verifier" --clean --noconfirm src/main.py'
+        cmd = [
+            python_cmd, "-m", "PyInstaller", "--onefile",
+            "--add-data", "src/images:images", "--add-data", "src/wordlists:wordlists",
+            "--name", "PASS-FAIL-Hash-Verifier", "--clean", "--noconfirm", "src/main.py",
+        ]
         build_type = "Linux Executable"
         
     else:
@@ -139,14 +172,15 @@ app = BUNDLE(coll, name='PASS-FAIL-Hash-Verifier.app', icon='icons/app_icon.icns
         # List what was created
         if os.path.exists("dist"):
             print("📋 Created files:")
-            for item in os.listdir("dist"):
-                item_path = os.path.join("dist", item)
-                if os.path.isfile(item_path):
-                    size = os.path.getsize(item_path)
-                    size_mb = size / (1024 * 1024)
-                    print(f"   📄 {item} ({size_mb:.1f} MB)")
-                elif os.path.isdir(item_path):
-                    print(f"   📁 {item}/")
+            # scandir entries carry their file type, so only files need a stat()
+            with os.scandir("dist") as entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False):
+                        size = entry.stat(follow_symlinks=False).st_size
+                        size_mb = size / (1024 * 1024)
+                        print(f"   📄 {entry.name} ({size_mb:.1f} MB)")
+                    elif entry.is_dir(follow_symlinks=False):
+                        print(f"   📁 {entry.name}/")
         
         # Platform-specific instructions
         if current_os == "Darwin":
@@ -177,21 +211,19 @@ def main():
         return False
     
     # Get the virtual environment Python path
-    if platform.system() == "Windows":
-        python_cmd = os.path.join(".venv", "Scripts", "python.exe")
-        if not os.path.exists(python_cmd):
-            python_cmd = "python"
-    else:
-        python_cmd = os.path.join(".venv", "bin", "python")
-        if not os.path.exists(python_cmd):
-            python_cmd = "python3"
+    python_cmd = _venv_python()
     
     # Check if PyInstaller is installed
     try:
         subprocess.run([python_cmd, "-c", "import PyInstaller"], check=True, capture_output=True)
     except subprocess.CalledProcessError:
         print("❌ PyInstaller not found. Installing...")
-        if not run_command(f"{python_cmd} -m pip install pyinstaller", "Installing PyInstaller"):
+        pip_env = dict(os.environ, PIP_CACHE_DIR=PIP_CACHE_DIR)
+        pip_cmd = [
+            python_cmd, "-m", "pip", "install", "--prefer-binary",
+            "--cache-dir", PIP_CACHE_DIR, f"pyinstaller=={PYINSTALLER_VERSION}",
+        ]
+        if not run_command(pip_cmd, "Installing PyInstaller", env=pip_env):
             return False
     
     # Build the app
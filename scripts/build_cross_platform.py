@@ -6,7 +6,7 @@ This script builds the PASS // FAIL Hash Verifier app for multiple platforms
 with platform-appropriate icons and configurations.
 
 Usage:
-    python build_cross_platform.py [platform]
+    python build_cross_platform.py [platform] [--fresh]
     
     platform options:
     - macos (default on macOS)
@@ -14,6 +14,9 @@ Usage:
     - linux (creates Linux executable)
     - all (creates all platform builds)
 
+    --fresh: pass --clean to PyInstaller and discard its cache (by default
+             the build/ work directory is reused so later builds are incremental)
+
 Features:
 - Uses appropriate icon format for each platform
 - Optimizes build settings per platform
@@ -24,14 +27,38 @@ Features:
 import os
 import sys
 import shutil
+import hashlib
 import subprocess
+import tarfile
+import zipfile
+import tempfile
+import urllib.request
 import platform as sys_platform
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-def clean_previous_builds():
-    """Remove previous build and dist directories"""
+# Pinned UPX release used to compress the Windows and Linux executables
+UPX_VERSION = "4.2.4"
+UPX_DIR = os.path.join("tools", "upx")
+# (system, machine) -> (archive name, SHA-256 of the archive). An archive is
+# only used once its hash is pinned here; fill in the value from the release
+# page when bumping UPX_VERSION. Anything unlisted builds without UPX.
+UPX_DOWNLOADS = {
+    ("Windows", "x86_64"): (f"upx-{UPX_VERSION}-win64.zip", None),
+    ("Linux", "x86_64"): (f"upx-{UPX_VERSION}-amd64_linux.tar.xz", None),
+    ("Linux", "aarch64"): (f"upx-{UPX_VERSION}-arm64_linux.tar.xz", None),
+}
+
+def clean_previous_builds(fresh=False):
+    """
+    Remove previous build output.
+    
+    dist/ is always removed. build/ holds PyInstaller's work cache and is
+    only removed for a fresh build.
+    """
     print("🧹 Cleaning previous builds...")
-    dirs_to_remove = ["build", "dist"]
+    dirs_to_remove = ["build", "dist"] if fresh else ["dist"]
     
     for dir_name in dirs_to_remove:
         if os.path.exists(dir_name):
@@ -43,28 +70,61 @@ def clean_previous_builds():
     
     print("✅ Cleanup completed!")
 
-def create_macos_spec():
-    """Create PyInstaller spec file optimized for macOS"""
-    spec_content = '''# -*- mode: python ; coding: utf-8 -*-
-
-from PyInstaller.utils.hooks import collect_all
+# Per-platform settings for the generated PyInstaller spec files
+SPEC_PLATFORMS = {
+    "macos": {
+        "spec_file": "PASS-FAIL-Hash-Verifier-macOS.spec",
+        "icon": "icons/app_icon.icns",
+        "target_arch": None,
+        "onefile": False,
+        "bundle": True,
+        "upx": False,
+    },
+    "windows": {
+        "spec_file": "PASS-FAIL-Hash-Verifier-Windows.spec",
+        "icon": "icons/app_icon.ico",
+        "target_arch": None,
+        "onefile": True,
+        "bundle": False,
+        "upx": True,
+    },
+    "linux": {
+        "spec_file": "PASS-FAIL-Hash-Verifier-Linux.spec",
+        "icon": None,
+        "target_arch": None,
+        "onefile": True,
+        "bundle": False,
+        "upx": True,
+    },
+}
+
+def _render_spec(platform, **opts):
+    """
+    Render the PyInstaller spec file contents for a platform.
+    
+    Args:
+        platform (str): One of the SPEC_PLATFORMS keys
+        **opts: Overrides for that platform's SPEC_PLATFORMS settings
+    
+    Returns:
+        str: The spec file contents
+    """
+    config = dict(SPEC_PLATFORMS[platform], **opts)
+    icon = config["icon"]
+    target_arch = config["target_arch"]
+    upx = config["upx"]
+    
+    spec = '''# -*- mode: python ; coding: utf-8 -*-
 
-# Collect all data and imports
-datas = []
-binaries = []
-hiddenimports = []
+import os
+import sys
 
-# PIL/Pillow support
-tmp_ret = collect_all('PIL')
-datas += tmp_ret[0]
-binaries += tmp_ret[1]
-hiddenimports += tmp_ret[2]
+# Shared, cached collect_all() results (see scripts/pass_fail_hooks.py)
+sys.path.insert(0, os.path.join(SPECPATH, 'scripts'))
+from pass_fail_hooks import load_cached_collect
 
-# tkinterdnd2 support
-tmp_ret = collect_all('tkinterdnd2')
-datas += tmp_ret[0] 
-binaries += tmp_ret[1]
-hiddenimports += tmp_ret[2]
+# Collect all data and imports for PIL/Pillow and tkinterdnd2
+datas, binaries, hiddenimports = load_cached_collect(['PIL', 'tkinterdnd2'])
 
 # Add explicit hidden imports
 hiddenimports += [
@@ -76,152 +136,223 @@ hiddenimports += [
 # Add data files
 datas += [('src/images', 'images'), ('src/wordlists', 'wordlists')]
 
+# Standard library packages the app never imports (test suites, packaging
+# and developer tools), left out to shrink the archive and speed up Analysis
+excludes = [
+    'test', 'tkinter.test', 'unittest', 'doctest', 'pydoc', 'pydoc_data',
+    'lib2to3', 'distutils', 'setuptools', 'pkg_resources', 'ensurepip', 'venv',
+    'idlelib', 'turtle', 'turtledemo', 'xmlrpc',
+]
+
 a = Analysis(['src/main.py'], pathex=[], binaries=binaries, datas=datas,
              hiddenimports=hiddenimports, hookspath=[], hooksconfig={},
-             runtime_hooks=[], excludes=[], noarchive=False, optimize=0)
+             runtime_hooks=[], excludes=excludes, noarchive=False, optimize=2)
 
 pyz = PYZ(a.pure, a.zipped_data, cipher=None)
 
-exe = EXE(pyz, a.scripts, [], exclude_binaries=True, name='PASS-FAIL-Hash-Verifier',
-          debug=False, bootloader_ignore_signals=False, strip=False, upx=True,
+'''
+    
+    if config["onefile"]:
+        icon_arg = f", icon={icon!r}" if icon else ""
+        spec += f'''exe = EXE(pyz, a.scripts, a.binaries, a.datas, [], name='PASS-FAIL-Hash-Verifier',
+          debug=False, bootloader_ignore_signals=False, strip=False, upx={upx},
+          runtime_tmpdir=None, console=False, disable_windowed_traceback=False,
+          argv_emulation=False, target_arch={target_arch!r}, codesign_identity=None,
+          entitlements_file=None{icon_arg})
+'''
+    else:
+        if not upx:
+            spec += '''# UPX is disabled on macOS: it cannot usefully compress the Mach-O binaries
+# in an .app bundle and breaks their code signatures
+'''
+        spec += f'''exe = EXE(pyz, a.scripts, [], exclude_binaries=True, name='PASS-FAIL-Hash-Verifier',
+          debug=False, bootloader_ignore_signals=False, strip=False, upx={upx},
           console=False, disable_windowed_traceback=False, argv_emulation=False,
-          target_arch=None, codesign_identity=None, entitlements_file=None)
-
-coll = COLLECT(exe, a.binaries, a.datas, strip=False, upx=True, upx_exclude=[], name='PASS-FAIL-Hash-Verifier')
+          target_arch={target_arch!r}, codesign_identity=None, entitlements_file=None)
 
-app = BUNDLE(coll, name='PASS-FAIL-Hash-Verifier.app', icon='icons/app_icon.icns',
+coll = COLLECT(exe, a.binaries, a.datas, strip=False, upx={upx}, upx_exclude=[], name='PASS-FAIL-Hash-Verifier')
+'''
+    
+    if config["bundle"]:
+        spec += f'''
+app = BUNDLE(coll, name='PASS-FAIL-Hash-Verifier.app', icon={icon!r},
              bundle_identifier='com.hashverifier.pass-fail-hash-verifier',
-             info_plist={
+             info_plist={{
                 'NSPrincipalClass': 'NSApplication', 
                 'NSAppleScriptEnabled': False, 
                 'NSHighResolutionCapable': 'True',
                 'CFBundleDisplayName': 'PASS // FAIL Hash Verifier',
                 'CFBundleVersion': '2.0.0',
                 'CFBundleShortVersionString': '2.0'
-             })
+             }})
 '''
     
-    with open("PASS-FAIL-Hash-Verifier-macOS.spec", "w") as f:
-        f.write(spec_content)
-    
-    return "PASS-FAIL-Hash-Verifier-macOS.spec"
-
-def create_windows_spec():
-    """Create PyInstaller spec file optimized for Windows"""
-    spec_content = '''# -*- mode: python ; coding: utf-8 -*-
-
-from PyInstaller.utils.hooks import collect_all
-
-# Collect all data and imports
-datas = []
-binaries = []
-hiddenimports = []
-
-# PIL/Pillow support
-tmp_ret = collect_all('PIL')
-datas += tmp_ret[0]
-binaries += tmp_ret[1]
-hiddenimports += tmp_ret[2]
+    return spec
 
-# tkinterdnd2 support
-tmp_ret = collect_all('tkinterdnd2')
-datas += tmp_ret[0] 
-binaries += tmp_ret[1]
-hiddenimports += tmp_ret[2]
-
-# Add explicit hidden imports
-hiddenimports += [
-    'PIL._imaging', 'PIL.Image', 'PIL.ImageTk', 'tkinterdnd2',
-    'tkinter', 'tkinter.messagebox', 'tkinter.filedialog', 'tkinter.ttk',
-    'hashlib', 'threading', 'os', 'sys', 'time', 'math', 'collections', 'platform',
-]
-
-# Add data files
-datas += [('src/images', 'images'), ('src/wordlists', 'wordlists')]
-
-a = Analysis(['src/main.py'], pathex=[], binaries=binaries, datas=datas,
-             hiddenimports=hiddenimports, hookspath=[], hooksconfig={},
-             runtime_hooks=[], excludes=[], noarchive=False, optimize=0)
-
-pyz = PYZ(a.pure, a.zipped_data, cipher=None)
-
-exe = EXE(pyz, a.scripts, a.binaries, a.datas, [], name='PASS-FAIL-Hash-Verifier',
-          debug=False, bootloader_ignore_signals=False, strip=False, upx=True,
-          runtime_tmpdir=None, console=False, disable_windowed_traceback=False,
-          argv_emulation=False, target_arch=None, codesign_identity=None,
-          entitlements_file=None, icon='icons/app_icon.ico')
-'''
+def create_spec(platform, **opts):
+    """
+    Write the PyInstaller spec file for a platform into the project root.
     
-    with open("PASS-FAIL-Hash-Verifier-Windows.spec", "w") as f:
-        f.write(spec_content)
-    
-    return "PASS-FAIL-Hash-Verifier-Windows.spec"
-
-def create_linux_spec():
-    """Create PyInstaller spec file optimized for Linux"""
-    spec_content = '''# -*- mode: python ; coding: utf-8 -*-
-
-from PyInstaller.utils.hooks import collect_all
-
-# Collect all data and imports
-datas = []
-binaries = []
-hiddenimports = []
-
-# PIL/Pillow support
-tmp_ret = collect_all('PIL')
-datas += tmp_ret[0]
-binaries += tmp_ret[1]
-hiddenimports += tmp_ret[2]
-
-# tkinterdnd2 support
-tmp_ret = collect_all('tkinterdnd2')
-datas += tmp_ret[0] 
-binaries += tmp_ret[1]
-hiddenimports += tmp_ret[2]
-
-# Add explicit hidden imports
-hiddenimports += [
-    'PIL._imaging', 'PIL.Image', 'PIL.ImageTk', 'tkinterdnd2',
-    'tkinter', 'tkinter.messagebox', 'tkinter.filedialog', 'tkinter.ttk',
-    'hashlib', 'threading', 'os', 'sys', 'time', 'math', 'collections', 'platform',
-]
-
-# Add data files
-datas += [('src/images', 'images'), ('src/wordlists', 'wordlists')]
-
-a = Analysis(['src/main.py'], pathex=[], binaries=binaries, datas=datas,
-             hiddenimports=hiddenimports, hookspath=[], hooksconfig={},
-             runtime_hooks=[], excludes=[], noarchive=False, optimize=0)
-
-pyz = PYZ(a.pure, a.zipped_data, cipher=None)
-
-exe = EXE(pyz, a.scripts, a.binaries, a.datas, [], name='PASS-FAIL-Hash-Verifier',
-          debug=False, bootloader_ignore_signals=False, strip=False, upx=True,
-          runtime_tmpdir=None, console=False, disable_windowed_traceback=False,
-          argv_emulation=False, target_arch=None, codesign_identity=None,
-          entitlements_file=None)
-'''
+    Args:
+        platform (str): One of the SPEC_PLATFORMS keys
+        **opts: Overrides passed through to _render_spec()
     
-    with open("PASS-FAIL-Hash-Verifier-Linux.spec", "w") as f:
-        f.write(spec_content)
+    Returns:
+        str: Name of the spec file that was written
+    """
+    spec_file = SPEC_PLATFORMS[platform]["spec_file"]
+    with open(spec_file, "w") as f:
+        f.write(_render_spec(platform, **opts))
     
-    return "PASS-FAIL-Hash-Verifier-Linux.spec"
+    return spec_file
 
 def cleanup_temp_specs():
     """Remove temporary spec files from root directory"""
-    spec_files = [
-        "PASS-FAIL-Hash-Verifier-macOS.spec",
-        "PASS-FAIL-Hash-Verifier-Windows.spec", 
-        "PASS-FAIL-Hash-Verifier-Linux.spec"
-    ]
-    
-    for spec_file in spec_files:
+    for settings in SPEC_PLATFORMS.values():
+        spec_file = settings["spec_file"]
         if os.path.exists(spec_file):
             os.remove(spec_file)
             print(f"🧹 Cleaned up: {spec_file}")
 
-def build_macos():
+def clean_pyinstaller_cache():
+    """
+    Empty PyInstaller's per-user cache, as --clean would.
+    
+    The parallel "all" build clears the cache once up front instead of
+    passing --clean to each run, which would wipe it while the other runs
+    are reading it.
+    """
+    try:
+        from PyInstaller.configure import get_config
+    except ImportError:
+        print("⚠️  PyInstaller is not importable here, its cache was left in place")
+        return
+    
+    cache_dir = get_config()["cachedir"]
+    if os.path.exists(cache_dir):
+        shutil.rmtree(cache_dir)
+        print(f"🧹 Cleaned PyInstaller cache: {cache_dir}")
+
+def clean_platform_dist(dist_dir):
+    """Remove a single platform's staging directory under dist/"""
+    if os.path.exists(dist_dir):
+        shutil.rmtree(dist_dir)
+        print(f"  🗑️  Removed {dist_dir}/")
+
+def _find_upx():
+    """
+    Locate a UPX binary for PyInstaller, downloading the pinned release if needed.
+    
+    Looks in tools/upx/ first, then on PATH, and otherwise downloads UPX
+    into tools/upx/ for the machine running the build.
+    
+    Returns:
+        str or None: Directory containing the upx binary, or None if UPX is
+        unavailable (the build then continues without compression)
+    """
+    upx_name = "upx.exe" if sys_platform.system() == "Windows" else "upx"
+    local_upx = os.path.join(UPX_DIR, upx_name)
+    if os.path.exists(local_upx):
+        return UPX_DIR
+    
+    upx_on_path = shutil.which("upx")
+    if upx_on_path:
+        return os.path.dirname(upx_on_path)
+    
+    # Windows reports AMD64/ARM64, Linux x86_64/aarch64
+    machine = sys_platform.machine().lower()
+    machine = {"amd64": "x86_64", "arm64": "aarch64"}.get(machine, machine)
+    archive_name, archive_sha256 = UPX_DOWNLOADS.get((sys_platform.system(), machine), (None, None))
+    if archive_name is None:
+        print(f"⚠️  UPX is not available for {sys_platform.system()}/{machine}, building without compression")
+        return None
+    if archive_sha256 is None:
+        print(f"⚠️  No pinned SHA-256 for {archive_name}, building without compression")
+        return None
+    
+    url = f"https://github.com/upx/upx/releases/download/v{UPX_VERSION}/{archive_name}"
+    print(f"📥 Downloading UPX {UPX_VERSION}...")
+    try:
+        os.makedirs(UPX_DIR, exist_ok=True)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            archive_path = os.path.join(temp_dir, archive_name)
+            urllib.request.urlretrieve(url, archive_path)
+            
+            # Never unpack (let alone run) an archive that isn't the pinned one
+            with open(archive_path, "rb") as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+            if digest != archive_sha256:
+                os.remove(archive_path)
+                print(f"⚠️  {archive_name} failed its SHA-256 check, building without compression")
+                return None
+            
+            if archive_name.endswith(".zip"):
+                with zipfile.ZipFile(archive_path) as archive:
+                    member = next(n for n in archive.namelist() if n.endswith("/" + upx_name))
+                    data = archive.read(member)
+            else:
+                with tarfile.open(archive_path) as archive:
+                    member = next(m for m in archive.getmembers() if m.name.endswith("/" + upx_name))
+                    data = archive.extractfile(member).read()
+            
+            # Write next to the final path and rename, so parallel builds
+            # never pick up a partially written binary
+            temp_upx = os.path.join(UPX_DIR, f"{upx_name}.{os.getpid()}.tmp")
+            with open(temp_upx, "wb") as f:
+                f.write(data)
+            os.chmod(temp_upx, 0o755)
+            os.replace(temp_upx, local_upx)
+        
+        print(f"✅ UPX installed in {UPX_DIR}/")
+        return UPX_DIR
+    except Exception as e:
+        print(f"⚠️  Could not download UPX ({e}), building without compression")
+        return None
+
+def pyinstaller_command(spec_file, fresh=False, dist_dir="dist", upx_dir=None):
+    """
+    Build the PyInstaller command line for a spec file.
+    
+    PyInstaller keeps its Analysis results and PYZ cache under build/<name>/,
+    so unless a fresh build is requested we leave out --clean and let later
+    builds reuse that work.
+    """
+    command = ["pyinstaller", "--noconfirm", "--distpath", dist_dir]
+    if fresh:
+        command.append("--clean")
+    if upx_dir:
+        command += ["--upx-dir", upx_dir]
+    command.append(spec_file)
+    return command
+
+def run_pyinstaller(command, label):
+    """
+    Run PyInstaller and stream its output live, prefixed with the platform.
+    
+    Output is read line by line instead of being captured, so a full pipe
+    can never stall PyInstaller and memory use stays constant. Only the last
+    lines are kept for the error report.
+    
+    Args:
+        command (list): PyInstaller command line
+        label (str): Prefix for each output line (e.g. "linux")
+    
+    Raises:
+        subprocess.CalledProcessError: If PyInstaller exits with an error;
+            .stdout holds the last lines of its output
+    """
+    tail = deque(maxlen=200)
+    with subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                          text=True, bufsize=1) as process:
+        for line in process.stdout:
+            tail.append(line)
+            sys.stdout.write(f"  [{label}] {line}")
+            sys.stdout.flush()
+    
+    if process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, command, output="".join(tail))
+
+def build_macos(fresh=False, dist_dir="dist"):
     """Build macOS application"""
     print("🍎 Building macOS Application...")
     
@@ -229,17 +360,15 @@ def build_macos():
         print("❌ Error: icons/app_icon.icns not found. Run scripts/create_cross_platform_icons.py first.")
         return False
     
-    spec_file = create_macos_spec()
+    spec_file = create_spec("macos")
     
     try:
-        result = subprocess.run([
-            "pyinstaller", "--clean", "--noconfirm", spec_file
-        ], check=True, capture_output=True, text=True)
+        run_pyinstaller(pyinstaller_command(spec_file, fresh, dist_dir), "macos")
         
-        if os.path.exists("dist/PASS-FAIL-Hash-Verifier.app"):
-            size = shutil.disk_usage("dist").used
+        app_path = os.path.join(dist_dir, "PASS-FAIL-Hash-Verifier.app")
+        if os.path.exists(app_path):
             print("✅ macOS build completed successfully!")
-            print(f"📂 Output: dist/PASS-FAIL-Hash-Verifier.app")
+            print(f"📂 Output: {app_path}")
             return True
         else:
             print("❌ macOS build failed - no output file created")
@@ -248,16 +377,14 @@ def build_macos():
     except subprocess.CalledProcessError as e:
         print(f"❌ macOS build failed: {e}")
         if e.stdout:
-            print("STDOUT:", e.stdout[-500:])  # Last 500 chars
-        if e.stderr:
-            print("STDERR:", e.stderr[-500:])  # Last 500 chars
+            print("Last output:", e.stdout[-500:])  # Last 500 chars
         return False
     finally:
         # Clean up temporary spec file
         if spec_file and os.path.exists(spec_file):
             os.remove(spec_file)
 
-def build_windows():
+def build_windows(fresh=False, dist_dir="dist", upx_dir=None):
     """Build Windows executable"""
     print("🪟 Building Windows Executable...")
     
@@ -265,18 +392,17 @@ def build_windows():
         print("❌ Error: icons/app_icon.ico not found. Run scripts/create_cross_platform_icons.py first.")
         return False
     
-    spec_file = create_windows_spec()
+    spec_file = create_spec("windows")
     
     try:
-        result = subprocess.run([
-            "pyinstaller", "--clean", "--noconfirm", spec_file
-        ], check=True, capture_output=True, text=True)
+        run_pyinstaller(pyinstaller_command(spec_file, fresh, dist_dir, upx_dir), "windows")
         
-        if os.path.exists("dist/PASS-FAIL-Hash-Verifier.exe"):
-            file_size = os.path.getsize("dist/PASS-FAIL-Hash-Verifier.exe")
+        exe_path = os.path.join(dist_dir, "PASS-FAIL-Hash-Verifier.exe")
+        if os.path.exists(exe_path):
+            file_size = os.path.getsize(exe_path)
             size_mb = file_size / (1024 * 1024)
             print("✅ Windows build completed successfully!")
-            print(f"📂 Output: dist/PASS-FAIL-Hash-Verifier.exe ({size_mb:.1f} MB)")
+            print(f"📂 Output: {exe_path} ({size_mb:.1f} MB)")
             return True
         else:
             print("❌ Windows build failed - no output file created")
@@ -290,22 +416,21 @@ def build_windows():
         if spec_file and os.path.exists(spec_file):
             os.remove(spec_file)
 
-def build_linux():
+def build_linux(fresh=False, dist_dir="dist", upx_dir=None):
     """Build Linux executable"""
     print("🐧 Building Linux Executable...")
     
-    spec_file = create_linux_spec()
+    spec_file = create_spec("linux")
     
     try:
-        result = subprocess.run([
-            "pyinstaller", "--clean", "--noconfirm", spec_file
-        ], check=True, capture_output=True, text=True)
+        run_pyinstaller(pyinstaller_command(spec_file, fresh, dist_dir, upx_dir), "linux")
         
-        if os.path.exists("dist/PASS-FAIL-Hash-Verifier"):
-            file_size = os.path.getsize("dist/PASS-FAIL-Hash-Verifier")
+        exe_path = os.path.join(dist_dir, "PASS-FAIL-Hash-Verifier")
+        if os.path.exists(exe_path):
+            file_size = os.path.getsize(exe_path)
             size_mb = file_size / (1024 * 1024)
             print("✅ Linux build completed successfully!")
-            print(f"📂 Output: dist/PASS-FAIL-Hash-Verifier ({size_mb:.1f} MB)")
+            print(f"📂 Output: {exe_path} ({size_mb:.1f} MB)")
             print(f"📁 Icons available in: icons/linux_icons/")
             return True
         else:
@@ -323,14 +448,20 @@ def build_linux():
 def main():
     """Main build function"""
     # Parse command line arguments
+    args = sys.argv[1:]
+    fresh = "--fresh" in args
+    args = [arg for arg in args if arg != "--fresh"]
+    
     target_platform = "macos"  # default
-    if len(sys.argv) > 1:
-        target_platform = sys.argv[1].lower()
+    if args:
+        target_platform = args[0].lower()
     
     print("🚀 Cross-Platform Build Script")
     print("=" * 50)
     print(f"🎯 Target platform: {target_platform}")
     print(f"💻 Running on: {sys_platform.system()}")
+    if fresh:
+        print("🧼 Fresh build: PyInstaller cache will be discarded")
     print()
     
     # Check if PyInstaller is available
@@ -341,30 +472,58 @@ def main():
         print("Install it with: pip install pyinstaller")
         return
     
-    # Clean previous builds
-    clean_previous_builds()
-    print()
+    # Resolve (and if needed download) UPX once, before any build starts
+    upx_dir = _find_upx() if target_platform in ("all", "windows", "linux") else None
     
     success_count = 0
     
     if target_platform == "all":
-        # Build all platforms
+        # Build all platforms, keeping build/ so the per-spec PyInstaller caches
+        # survive and staging each platform into its own dist/<platform>/
+        if fresh:
+            # Clean once here; the parallel runs then go without --clean so
+            # none of them wipes the shared cache under the others
+            clean_previous_builds(fresh)
+            clean_pyinstaller_cache()
+        else:
+            cleanup_temp_specs()
+        print()
+        
+        # Each spec has its own build/ work directory and dist/ staging
+        # directory, so the three PyInstaller runs can go in parallel
         platforms = [("macos", build_macos), ("windows", build_windows), ("linux", build_linux)]
-        for platform_name, build_func in platforms:
-            print(f"Building {platform_name}...")
-            if build_func():
-                success_count += 1
-            print()
+        with ProcessPoolExecutor(max_workers=len(platforms)) as executor:
+            futures = {}
+            for platform_name, build_func in platforms:
+                print(f"Building {platform_name}...")
+                dist_dir = os.path.join("dist", platform_name)
+                clean_platform_dist(dist_dir)
+                if platform_name == "macos":
+                    futures[platform_name] = executor.submit(build_func, False, dist_dir)
+                else:
+                    futures[platform_name] = executor.submit(build_func, False, dist_dir, upx_dir)
+            
+            for platform_name, future in futures.items():
+                try:
+                    if future.result():
+                        success_count += 1
+                except Exception as e:
+                    print(f"❌ {platform_name} build failed: {e}")
+        print()
     else:
+        # Clean previous builds
+        clean_previous_builds(fresh)
+        print()
+        
         # Build specific platform
         if target_platform == "macos":
-            if build_macos():
+            if build_macos(fresh):
                 success_count = 1
         elif target_platform == "windows":
-            if build_windows():
+            if build_windows(fresh, upx_dir=upx_dir):
                 success_count = 1
         elif target_platform == "linux":
-            if build_linux():
+            if build_linux(fresh, upx_dir=upx_dir):
                 success_count = 1
         else:
             print(f"❌ Unknown platform: {target_platform}")
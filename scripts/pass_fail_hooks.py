@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Shared PyInstaller helpers for the PASS // FAIL spec files.
+
+Every spec needs the data files, binaries and hidden imports of PIL and
+tkinterdnd2. Finding them with collect_all() walks each package's tree in
+site-packages, so the result is pickled under build/collect_cache/ and
+reused by later builds (and by the other platform specs).
+
+The cache key includes the package version, the PyInstaller version and
+the Python version, so upgrading any of them triggers a fresh collection.
+Building with --fresh removes build/ and therefore the cache as well.
+
+Usage (inside a .spec file; SPECPATH is the directory holding the spec):
+    # Specs in the repo root (the ones build_app.py and
+    # build_cross_platform.py generate)
+    sys.path.insert(0, os.path.join(SPECPATH, 'scripts'))
+    # Specs in specs/ (the checked-in copies)
+    sys.path.insert(0, os.path.join(SPECPATH, os.pardir, 'scripts'))
+    
+    from pass_fail_hooks import load_cached_collect
+    datas, binaries, hiddenimports = load_cached_collect(['PIL', 'tkinterdnd2'])
+"""
+
+import os
+import sys
+import pickle
+import hashlib
+import importlib
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_DIR = os.path.join(PROJECT_ROOT, "build", "collect_cache")
+
+
+def _cache_key(package):
+    """
+    Build a cache key for a package's collect_all() result.
+
+    Args:
+        package (str): Importable package name (e.g. "PIL")
+
+    Returns:
+        str: Hex digest identifying this package/toolchain combination
+    """
+    import PyInstaller
+
+    module = importlib.import_module(package)
+    version = getattr(module, "__version__", None)
+    if version is None:
+        # Not every package exposes __version__; fall back to its location
+        # and modification time so reinstalling still invalidates the entry
+        module_file = getattr(module, "__file__", "") or ""
+        version = f"{module_file}:{os.path.getmtime(module_file) if module_file else 0}"
+
+    key = f"{package}|{version}|{PyInstaller.__version__}|{sys.version}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def cached_collect_all(package):
+    """
+    Return collect_all(package), reusing a pickled result when available.
+
+    Args:
+        package (str): Importable package name
+
+    Returns:
+        tuple: (datas, binaries, hiddenimports) as returned by collect_all
+    """
+    from PyInstaller.utils.hooks import collect_all
+
+    cache_path = os.path.join(CACHE_DIR, f"{package}-{_cache_key(package)}.pickle")
+
+    try:
+        with open(cache_path, "rb") as file:
+            return pickle.load(file)
+    except (OSError, pickle.PickleError, EOFError):
+        pass  # Missing or unreadable cache entry - collect again
+
+    result = collect_all(package)
+
+    # Write to a temporary file and rename, so specs built in parallel never
+    # see a half-written cache entry
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as file:
+        pickle.dump(result, file)
+    os.replace(temp_path, cache_path)
+
+    return result
+
+
+def load_cached_collect(packages):
+    """
+    Collect and merge the PyInstaller inputs for several packages.
+
+    Args:
+        packages (list): Importable package names
+
+    Returns:
+        tuple: (datas, binaries, hiddenimports) lists ready for Analysis()
+    """
+    datas = []
+    binaries = []
+    hiddenimports = []
+
+    for package in packages:
+        package_datas, package_binaries, package_hiddenimports = cached_collect_all(package)
+        datas += package_datas
+        binaries += package_binaries
+        hiddenimports += package_hiddenimports
+
+    return datas, binaries, hiddenimports
@@ -1,23 +1,14 @@
 # -*- mode: python ; coding: utf-8 -*-
 
-from PyInstaller.utils.hooks import collect_all
+import os
+import sys
 
-# Collect all data and imports
-datas = []
-binaries = []
-hiddenimports = []
+# Shared, cached collect_all() results (see scripts/pass_fail_hooks.py)
+sys.path.insert(0, os.path.join(SPECPATH, os.pardir, 'scripts'))
+from pass_fail_hooks import load_cached_collect
 
-# PIL/Pillow support
-tmp_ret = collect_all('PIL')
-datas += tmp_ret[0]
-binaries += tmp_ret[1]
-hiddenimports += tmp_ret[2]
-
-# tkinterdnd2 support
-tmp_ret = collect_all('tkinterdnd2')
-datas += tmp_ret[0] 
-binaries += tmp_ret[1]
-hiddenimports += tmp_ret[2]
+# Collect all data and imports for PIL/Pillow and tkinterdnd2
+datas, binaries, hiddenimports = load_cached_collect(['PIL', 'tkinterdnd2'])
 
 # Add explicit hidden imports
 hiddenimports += [
@@ -29,9 +20,17 @@ hiddenimports += [
 # Add data files
 datas += [('src/images', 'images'), ('src/wordlists', 'wordlists')]
 
+# Standard library packages the app never imports (test suites, packaging
+# and developer tools), left out to shrink the archive and speed up Analysis
+excludes = [
+    'test', 'tkinter.test', 'unittest', 'doctest', 'pydoc', 'pydoc_data',
+    'lib2to3', 'distutils', 'setuptools', 'pkg_resources', 'ensurepip', 'venv',
+    'idlelib', 'turtle', 'turtledemo', 'xmlrpc',
+]
+
 a = Analysis(['src/main.py'], pathex=[], binaries=binaries, datas=datas,
              hiddenimports=hiddenimports, hookspath=[], hooksconfig={},
-             runtime_hooks=[], excludes=[], noarchive=False, optimize=0)
+             runtime_hooks=[], excludes=excludes, noarchive=False, optimize=2)
 
 pyz = PYZ(a.pure, a.zipped_data, cipher=None)
 
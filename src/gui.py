@@ -19,7 +19,9 @@ Performance Optimizations:
 - Terminal tag caching to avoid repeated color tag creation
 - Batched terminal updates to reduce UI flickering and improve responsiveness
 - Enhanced progress update throttling with smarter timing
-- Optimized animation frame rate (120ms) for better CPU efficiency
+- Time-based animation at a configurable frame rate (30 FPS by default)
+- Precomputed walk-cycle table so animation frames need no trig
+- Stick figure drawn from cached sprites: one canvas image item per frame
 - Batched widget state changes to minimize UI operations
 - Efficient terminal clearing with cache management
 
@@ -32,14 +34,17 @@ Perfect for beginners to learn about:
 
 import os
 import platform
+import queue
+import shutil
 import threading
 import math
 import time
 import tkinter as tk
+from collections import deque
 from tkinterdnd2 import TkinterDnD, DND_FILES
-from tkinter import Tk, Label, Entry, Listbox, END, Frame, filedialog, Text, DISABLED, NORMAL
+from tkinter import Tk, Label, Entry, Listbox, END, Frame, filedialog, Text
 from tkinter import ttk
-from PIL import Image, ImageTk
+from PIL import Image, ImageDraw, ImageTk
 from hash_verifier import verify_hash, get_available_wordlists
 
 
@@ -62,6 +67,106 @@ def get_os_font_size():
         return 12
 
 
+def get_cache_dir():
+    """
+    Get the per-user cache folder for PASS // FAIL, creating it if needed.
+    
+    Returns:
+        str: Cache folder path, following each OS's convention
+            - macOS: ~/Library/Caches/PASS_FAIL
+            - Windows: %LOCALAPPDATA%\\PASS_FAIL\\Cache
+            - Linux: $XDG_CACHE_HOME/pass_fail (default ~/.cache/pass_fail)
+    """
+    system = platform.system()
+    if system == "Darwin":  # macOS
+        cache_dir = os.path.join(os.path.expanduser("~"), "Library", "Caches", "PASS_FAIL")
+    elif system == "Windows":
+        base = os.environ.get("LOCALAPPDATA") or os.path.join(os.path.expanduser("~"), "AppData", "Local")
+        cache_dir = os.path.join(base, "PASS_FAIL", "Cache")
+    else:  # Linux and other Unix-like systems
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        cache_dir = os.path.join(base, "pass_fail")
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
+
+
+def load_resized_image(img_path, size):
+    """
+    Load an image resized to the given size, reusing a cached copy if possible.
+    
+    The LANCZOS resize of a large source image is done once; the result is
+    saved in the user cache folder (keyed by size and the source's
+    modification time) and loaded directly on later launches.
+    
+    Args:
+        img_path (str): Path to the source image
+        size (tuple): Target (width, height) in pixels
+    
+    Returns:
+        PIL.Image.Image: The resized image
+    """
+    width, height = size
+    name = os.path.splitext(os.path.basename(img_path))[0]
+    mtime = int(os.path.getmtime(img_path))
+    cache_path = None
+    try:
+        cache_path = os.path.join(get_cache_dir(), f"{name}_{width}x{height}_{mtime}.png")
+        if os.path.exists(cache_path):
+            cached = Image.open(cache_path)
+            cached.load()
+            return cached
+    except Exception:
+        pass  # Unreadable cache - fall back to resizing below
+    
+    resized = Image.open(img_path).resize((width, height), Image.Resampling.LANCZOS)
+    
+    if cache_path:
+        try:
+            # Write to a temporary file and rename, so a crash never leaves a
+            # half-written cache entry behind
+            temp_path = f"{cache_path}.{os.getpid()}.tmp"
+            resized.save(temp_path, "PNG", optimize=True)
+            os.replace(temp_path, cache_path)
+        except OSError:
+            pass  # Read-only or full disk - just resize again next launch
+    
+    return resized
+
+
+# Buffer for the userspace copy path; wordlists are often 100+ MB
+COPY_BUFFER_SIZE = 16 * 1024 * 1024
+
+
+def copy_file(src_path, dst_path):
+    """
+    Copy a file's contents and metadata (like shutil.copy2).
+    
+    Uses os.sendfile where the kernel supports file-to-file copies (Linux)
+    and otherwise falls back to copyfileobj with a large buffer.
+    
+    Args:
+        src_path (str): File to copy
+        dst_path (str): Destination file path
+    """
+    with open(src_path, 'rb') as src, open(dst_path, 'wb') as dst:
+        copied = 0
+        if hasattr(os, "sendfile"):
+            size = os.fstat(src.fileno()).st_size
+            try:
+                while copied < size:
+                    sent = os.sendfile(dst.fileno(), src.fileno(), copied, size - copied)
+                    if sent == 0:
+                        break
+                    copied += sent
+            except OSError:
+                pass  # e.g. macOS only sends to sockets - copy the rest below
+        # Whatever sendfile didn't cover (or everything, without it)
+        src.seek(copied)
+        dst.seek(copied)
+        shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+    shutil.copystat(src_path, dst_path)
+
+
 class StickFigureKeyLockProgress(ttk.Frame):
     """
     Animated progress indicator showing a stick figure carrying a key toward a lock.
@@ -85,10 +190,31 @@ class StickFigureKeyLockProgress(ttk.Frame):
         bg (str): Background color in hex format
         stick (str): Stick figure color in hex format
         text (str): Label text color in hex format
+        font_size (int): Base font size for the percent label
+        target_fps (int): Animation frame rate (default 30)
     """
 
+    # Poses per walk cycle, and how long one cycle takes. The walking speed
+    # only depends on WALK_CYCLE_SECONDS; the frame rate just decides how
+    # many of these poses get shown
+    PHASE_STEPS = 72
+    WALK_CYCLE_SECONDS = 2.16
+
+    # Celebration pulse: outline width toggles this often
+    PULSE_SECONDS = 0.12
+
+    # Sprites are drawn this many times larger, then scaled down (anti-aliasing)
+    SPRITE_SUPERSAMPLE = 3
+
+    # Quiet time after the last <Configure> event before re-laying out
+    RESIZE_SETTLE_MS = 50
+
+    # Shortest gap between redraws requested through threadsafe_set()
+    MIN_SET_INTERVAL = 1 / 60
+
     def __init__(self, master, width=820, height=160, maximum=100.0,
-                 bg="#1b0f2a", stick="#b086ff", text="#ffffff", font_size=12):
+                 bg="#1b0f2a", stick="#b086ff", text="#ffffff", font_size=12,
+                 target_fps=30):
         super().__init__(master)
         self._w_req = int(width)
         self._h_req = int(height)
@@ -107,18 +233,48 @@ class StickFigureKeyLockProgress(ttk.Frame):
         self._track_right = None
         self._figure_y = None
         self._travel_right = None
+        self._travel_span = None
 
         # Animation state
         self._anim_job = None
         self._anim_running = False
-        self._phase = 0.0
+        self._frame_interval = 1.0 / max(1, int(target_fps))
+        self._phase_idx = 0
+        self._phase_pos = 0.0
+        self._last_tick_ts = None
         self._celebrate_until = 0.0
         self._pulse_on = False
+        self._pulse_width = 1
+        self._shown_sprite = None
+        self._shown_pos = None
+        self._label_text = "0%"
+        self._layout_size = None
+        self._resize_job = None
+
+        # Latest-wins slot for threadsafe_set()
+        self._pending_lock = threading.Lock()
+        self._pending_value = None
+        self._pending_scheduled = False
+        self._last_drain_ts = 0.0
 
         # Geometry constants
         self._arm_len = 22
         self._key_head_r = 7
         self._key_shaft_len = 14
+        self._leg_len = 26
+        self._head_r = 10
+        self._torso_len = 26
+        # Vertical offsets from the figure's centre line, fixed for its size
+        self._head_dy = -self._head_r * 2
+        self._neck_dy = -self._head_r
+        self._shoulder_dy = self._neck_dy + 6
+        self._hip_dy = self._torso_len * 0.5
+        self._ground_dy = 20  # track_y - figure_y
+        self._phase_table = self._build_phase_table()
+
+        # Pre-rendered figure sprites, keyed by (phase_idx, key_width)
+        self._sprite_box = self._build_sprite_box()
+        self._sprites = {}
 
         # Canvas
         self.canvas = tk.Canvas(
@@ -130,8 +286,7 @@ class StickFigureKeyLockProgress(ttk.Frame):
 
         # Items
         self._create_items()
-        self._layout()
-        self._update_all(force=True)
+        self._layout()  # Also places the figure
 
     # Public API
     def set(self, value: float) -> None:
@@ -146,7 +301,14 @@ class StickFigureKeyLockProgress(ttk.Frame):
             self.celebrate(1200)
 
     def threadsafe_set(self, value: float) -> None:
-        self.after(0, self.set, value)
+        # Only the newest value matters, so a burst of updates from a worker
+        # thread is coalesced into a single pending callback
+        with self._pending_lock:
+            self._pending_value = value
+            if self._pending_scheduled:
+                return
+            self._pending_scheduled = True
+        self.after(0, self._drain_pending)
 
     def get(self) -> float:
         return self._value
@@ -155,14 +317,16 @@ class StickFigureKeyLockProgress(ttk.Frame):
         self._value = 0.0
         self._fraction = 0.0
         self._celebrate_until = 0.0
-        self._pulse_on = False
+        self._clear_pulse()
         self.canvas.itemconfigure(self.items["shackle_closed"], state="normal")
         self.canvas.itemconfigure(self.items["shackle_open"], state="hidden")
-        self._update_all(force=True)
+        self._update_label()
+        self._update_figure()
 
     def start(self) -> None:
         if not self._anim_running:
             self._anim_running = True
+            self._last_tick_ts = None
             self._schedule()
 
     def stop(self) -> None:
@@ -183,61 +347,139 @@ class StickFigureKeyLockProgress(ttk.Frame):
             self.start()
 
     # Internals
+    def _drain_pending(self):
+        # Cap redraws from threadsafe_set() at ~60 per second
+        now = time.monotonic()
+        wait = self.MIN_SET_INTERVAL - (now - self._last_drain_ts)
+        if wait > 0:
+            self.after(max(1, int(wait * 1000)), self._drain_pending)
+            return
+        with self._pending_lock:
+            value = self._pending_value
+            self._pending_value = None
+            self._pending_scheduled = False
+        self._last_drain_ts = now
+        if value is not None:
+            self.set(value)
+
     def _schedule(self):
         if self._anim_running:
-            self._tick()
-            # Optimized frame rate: 120ms instead of 90ms for better performance
-            # Still smooth enough for the animation but reduces CPU usage by ~25%
-            self._anim_job = self.after(120, self._schedule)
-
-    def _tick(self):
-        self._phase = (self._phase + 0.35) % (math.tau if hasattr(math, "tau") else (2 * math.pi))
-        if time.monotonic() < self._celebrate_until:
-            self._pulse_on = not self._pulse_on
+            # One clock read per frame, shared with _tick()
+            started = time.monotonic()
+            if self._value >= self._maximum and started >= self._celebrate_until:
+                # The figure has reached the lock and the celebration is over:
+                # nothing left to animate, so stop ticking until started again
+                # (leaving the outlines as they are when not pulsing)
+                self._anim_running = False
+                self._anim_job = None
+                self._clear_pulse()
+                self._update_figure()
+                return
+            self._tick(started)
+            # Aim for a steady frame rate: wait out whatever is left of this
+            # frame's budget after the drawing itself
+            spent = time.monotonic() - started
+            delay = max(1, int((self._frame_interval - spent) * 1000))
+            self._anim_job = self.after(delay, self._schedule)
+
+    def _build_phase_table(self):
+        """
+        Precompute the figure's per-phase offsets for one walk cycle.
+        
+        The walk phase is quantized to PHASE_STEPS equal steps per cycle, so the
+        bob and the arm/leg end offsets only ever take PHASE_STEPS values -
+        computing them once here keeps all trig out of the animation loop.
+        
+        Returns:
+            list: (bob, arm_dx, arm_dy, leg_dx, leg_dy) tuples, one per step
+        """
+        table = []
+        for idx in range(self.PHASE_STEPS):
+            phase = idx * math.tau / self.PHASE_STEPS
+            swing = math.sin(phase)
+            arm_angle = swing * 0.6
+            # Legs swing opposite to arms
+            leg_angle = -swing * 0.7
+            table.append((
+                4 * math.sin(phase * 2),
+                self._arm_len * math.cos(arm_angle),
+                self._arm_len * math.sin(arm_angle),
+                self._leg_len * math.cos(leg_angle),
+                self._leg_len * math.sin(leg_angle),
+            ))
+        return table
+
+    def _tick(self, now):
+        # Advance the walk by the time that actually passed, so timer jitter
+        # or a busy main loop never changes the walking speed
+        if self._last_tick_ts is not None:
+            dt = now - self._last_tick_ts
+            self._phase_pos = (self._phase_pos + dt * self.PHASE_STEPS / self.WALK_CYCLE_SECONDS) % self.PHASE_STEPS
+        self._last_tick_ts = now
+        self._phase_idx = int(self._phase_pos) % self.PHASE_STEPS
+        if now < self._celebrate_until:
+            self._pulse_on = int(now / self.PULSE_SECONDS) % 2 == 1
             width = 2 if self._pulse_on else 1
-            for name in ("key_head", "key_shaft", "key_tooth1", "key_tooth2", "lock_body", "keyhole_stem", "keyhole_oval"):
-                self.canvas.itemconfigure(self.items[name], width=width)
         else:
-            for name in ("key_head", "key_shaft", "key_tooth1", "key_tooth2", "lock_body", "keyhole_stem", "keyhole_oval"):
-                self.canvas.itemconfigure(self.items[name], width=1)
+            width = 1
+        # Outline widths only need touching when the pulse actually toggles
+        if width != self._pulse_width:
+            self._pulse_width = width
+            # The key's outline comes from the sprite (picked by _pulse_width)
+            self.canvas.itemconfigure("pulse", width=width)
         self._update_figure()
 
+    def _clear_pulse(self):
+        # Back to the resting outline width; the key sprite follows on the
+        # next _update_figure()
+        self._pulse_on = False
+        self._pulse_width = 1
+        self.canvas.itemconfigure("pulse", width=1)
+
     def _on_resize(self, event):
+        # Tk sends a burst of <Configure> events while the window is being
+        # dragged; only lay out once the size has settled
+        if self._resize_job is not None:
+            self.after_cancel(self._resize_job)
+        self._resize_job = self.after(self.RESIZE_SETTLE_MS, self._do_layout)
+
+    def _do_layout(self):
+        self._resize_job = None
+        # Only positions change on resize; _layout() moves the label and the
+        # figure, and the label text stays the same
         self._layout()
-        self._update_all(force=True)
 
     def _create_items(self):
         c = self.canvas
         col = self.colors
         items = {}
+        # Two layers: "static" items are only positioned by _layout() (the
+        # celebration may restyle them), while the "dynamic" figure is the
+        # only thing the animation frames ever move
         # Lock body + keyhole
-        items["lock_body"] = c.create_rectangle(0, 0, 0, 0, outline=col["stick"], width=1)
-        items["keyhole_oval"] = c.create_oval(0, 0, 0, 0, outline=col["stick"], width=1)
-        items["keyhole_stem"] = c.create_line(0, 0, 0, 0, fill=col["stick"], width=1, capstyle="round")
+        # (tagged "pulse" so the celebration can restyle them in one call)
+        items["lock_body"] = c.create_rectangle(0, 0, 0, 0, outline=col["stick"], width=1, tags=("static", "pulse"))
+        items["keyhole_oval"] = c.create_oval(0, 0, 0, 0, outline=col["stick"], width=1, tags=("static", "pulse"))
+        items["keyhole_stem"] = c.create_line(0, 0, 0, 0, fill=col["stick"], width=1, capstyle="round", tags=("static", "pulse"))
         # Shackle arcs (closed/open)
-        items["shackle_closed"] = c.create_arc(0, 0, 0, 0, start=0, extent=180, style="arc", outline=col["stick"], width=2)
-        items["shackle_open"] = c.create_arc(0, 0, 0, 0, start=300, extent=150, style="arc", outline=col["stick"], width=2, state="hidden")
-        # Stick figure
-        items["head"] = c.create_oval(0, 0, 0, 0, outline=col["stick"], width=2)
-        items["torso"] = c.create_line(0, 0, 0, 0, fill=col["stick"], width=2, capstyle="round")
-        items["arm_l"] = c.create_line(0, 0, 0, 0, fill=col["stick"], width=2, capstyle="round")
-        items["arm_r"] = c.create_line(0, 0, 0, 0, fill=col["stick"], width=2, capstyle="round")
-        items["leg_l"] = c.create_line(0, 0, 0, 0, fill=col["stick"], width=2, capstyle="round")
-        items["leg_r"] = c.create_line(0, 0, 0, 0, fill=col["stick"], width=2, capstyle="round")
-        # Key in right hand
-        items["key_head"] = c.create_oval(0, 0, 0, 0, outline=col["stick"], width=1)
-        items["key_shaft"] = c.create_line(0, 0, 0, 0, fill=col["stick"], width=1)
-        items["key_tooth1"] = c.create_line(0, 0, 0, 0, fill=col["stick"], width=1)
-        items["key_tooth2"] = c.create_line(0, 0, 0, 0, fill=col["stick"], width=1)
+        items["shackle_closed"] = c.create_arc(0, 0, 0, 0, start=0, extent=180, style="arc", outline=col["stick"], width=2, tags=("static",))
+        items["shackle_open"] = c.create_arc(0, 0, 0, 0, start=300, extent=150, style="arc", outline=col["stick"], width=2, state="hidden", tags=("static",))
+        # Stick figure with the key in its right hand, as one sprite image
+        items["figure"] = c.create_image(0, 0, anchor="nw", tags=("dynamic",))
         # Percent label
         items["label"] = c.create_text(0, 0, text="0%", fill=col["text"], 
-                                     font=("Segoe UI", max(8, self._font_size - 5), "bold"))
+                                     font=("Segoe UI", max(8, self._font_size - 5), "bold"), tags=("static",))
         self.items = items
 
     def _layout(self):
         c = self.canvas
         w = max(10, c.winfo_width())
         h = max(10, c.winfo_height())
+        # Tk also sends <Configure> for changes that keep the size; the static
+        # layer only needs placing again when the size really changed
+        if (w, h) == self._layout_size:
+            return
+        self._layout_size = (w, h)
         m = self._margin
         track_y = int(h * 0.64)
         self._track_y = track_y
@@ -245,7 +487,7 @@ class StickFigureKeyLockProgress(ttk.Frame):
         right = w - m
         self._track_left = left
         self._track_right = right
-        self._figure_y = track_y - 20
+        self._figure_y = track_y - self._ground_dy
 
         # Lock placement near right end
         body_w = 28
@@ -267,94 +509,183 @@ class StickFigureKeyLockProgress(ttk.Frame):
         shack_x2, shack_y2 = kh_cx + sh_r, body_top + sh_r
         c.coords(self.items["shackle_closed"], shack_x1, shack_y1, shack_x2, shack_y2)
         c.coords(self.items["shackle_open"], shack_x1 - 2, shack_y1 - 6, shack_x2 - 2, shack_y2 - 6)
-        c.itemconfigure(self.items["shackle_closed"], state="normal")
-        c.itemconfigure(self.items["shackle_open"], state="hidden")
+        # The open/closed shackle state is owned by reset() and celebrate(),
+        # so a resize after completion keeps the lock open
 
         # Travel clamp so key never overlaps the lock
         right_reach = self._arm_len + self._key_head_r + self._key_shaft_len
         clearance = 8
         self._travel_right = max(left + 10, body_left - (right_reach + clearance))
+        self._travel_span = self._travel_right - left
 
         # Percent label below the animation
         c.coords(self.items["label"], w / 2, track_y + 32)
 
-        # Initial placement
-        self._update_figure()
-
-    def _update_all(self, force=False):
-        self._update_label()
+        # Initial placement (geometry changed, so always reposition)
+        self._shown_pos = None
         self._update_figure()
 
     def _update_label(self):
         pct = int(round(self._fraction * 100))
-        self.canvas.itemconfigure(self.items["label"], text=f"{pct}%")
+        text = f"{pct}%"
+        # Changing a text item's text makes Tk re-layout it; skip when the
+        # percentage hasn't actually changed
+        if text == self._label_text:
+            return
+        self._label_text = text
+        self.canvas.itemconfigure(self.items["label"], text=text)
 
     def _update_figure(self):
         if self._track_left is None:
             return
-        right_limit = self._travel_right if self._travel_right is not None else self._track_right
-        x = self._track_left + self._fraction * (right_limit - self._track_left)
-        ground_y = self._track_y
-        base_y = self._figure_y
-        bob = 4 * math.sin(self._phase * 2)
-        y = base_y + bob
-
-        head_r = 10
-        torso_len = 26
-        arm_len = self._arm_len
-        leg_len = 26
-
-        swing = math.sin(self._phase)
-        arm_angle = swing * 0.6
-        # Legs swing opposite to arms
-        leg_angle = -swing * 0.7
-
-        neck = (x, y - head_r)
-        hip = (x, y + torso_len * 0.5)
-
-        hx, hy = (x, y - head_r * 2)
-        self.canvas.coords(self.items["head"], hx - head_r, hy - head_r, hx + head_r, hy + head_r)
-        self.canvas.coords(self.items["torso"], neck[0], neck[1], hip[0], hip[1])
+        x = int(self._track_left + self._fraction * self._travel_span)
+        # The whole figure is one image item: swap the sprite when the pose
+        # changes and move the item when the position changes - nothing else
+        canvas = self.canvas
+        figure = self.items["figure"]
+        sprite = self._get_sprite(self._phase_idx, self._pulse_width)
+        if sprite is not self._shown_sprite:
+            canvas.itemconfigure(figure, image=sprite)
+            self._shown_sprite = sprite
+        pos = (x + self._sprite_box[0], self._figure_y + self._sprite_box[1])
+        if pos != self._shown_pos:
+            canvas.coords(figure, *pos)
+            self._shown_pos = pos
+
+    def _figure_shapes(self, phase_idx, key_width=1):
+        """
+        Describe the stick figure and its key for one walk pose.
+        
+        Coordinates are relative to the figure's anchor point: x = 0 is the
+        figure's centre line and y = 0 is its resting height (_figure_y).
+        
+        Args:
+            phase_idx (int): Index into the walk-cycle table
+            key_width (int): Outline width for the key (2 while celebrating)
+        
+        Returns:
+            list: ("oval" | "line", coords, width) tuples
+        """
+        bob, arm_dx, arm_dy, leg_dx, leg_dy = self._phase_table[phase_idx]
+        y = bob
+        ground_y = self._ground_dy
+        head_r = self._head_r
+
+        neck = (0, y + self._neck_dy)
+        hip = (0, y + self._hip_dy)
+
+        shapes = []
+        hx, hy = (0, y + self._head_dy)
+        shapes.append(("oval", (hx - head_r, hy - head_r, hx + head_r, hy + head_r), 2))
+        shapes.append(("line", (neck[0], neck[1], hip[0], hip[1]), 2))
 
         ax = neck[0]
-        ay = neck[1] + 6
-        lax = ax + arm_len * math.cos(math.pi - arm_angle)
-        lay = ay + arm_len * math.sin(math.pi - arm_angle)
-        self.canvas.coords(self.items["arm_l"], ax, ay, lax, lay)
-        rax = ax + arm_len * math.cos(arm_angle)
-        ray = ay + arm_len * math.sin(arm_angle)
-        self.canvas.coords(self.items["arm_r"], ax, ay, rax, ray)
+        ay = y + self._shoulder_dy
+        # Left arm mirrors the right: cos(pi - a) = -cos(a), sin(pi - a) = sin(a)
+        lax = ax - arm_dx
+        lay = ay + arm_dy
+        shapes.append(("line", (ax, ay, lax, lay), 2))
+        rax = ax + arm_dx
+        ray = ay + arm_dy
+        shapes.append(("line", (ax, ay, rax, ray), 2))
 
         lx1 = hip[0]
         ly1 = hip[1]
         # Both legs swing opposite to arms, clamp so they never go above horizontal (hip level)
-        # Left leg
-        llx2 = lx1 + leg_len * math.cos(math.pi + leg_angle)
-        lly2 = ly1 + leg_len * math.sin(math.pi + leg_angle)
+        # Left leg: cos(pi + a) = -cos(a), sin(pi + a) = -sin(a)
+        llx2 = lx1 - leg_dx
+        lly2 = ly1 - leg_dy
         if lly2 < ly1:
             lly2 = ly1
         lly2 = min(ground_y, lly2)
-        self.canvas.coords(self.items["leg_l"], lx1, ly1, llx2, lly2)
+        shapes.append(("line", (lx1, ly1, llx2, lly2), 2))
         # Right leg
-        lrx2 = lx1 + leg_len * math.cos(leg_angle)
-        lry2 = ly1 + leg_len * math.sin(leg_angle)
+        lrx2 = lx1 + leg_dx
+        lry2 = ly1 + leg_dy
         if lry2 < ly1:
             lry2 = ly1
         lry2 = min(ground_y, lry2)
-        self.canvas.coords(self.items["leg_r"], lx1, ly1, lrx2, lry2)
+        shapes.append(("line", (lx1, ly1, lrx2, lry2), 2))
 
+        # Key in right hand
         kx, ky = rax, ray
         kh = self._key_head_r
         shaft = self._key_shaft_len
-        self.canvas.coords(self.items["key_head"], kx - kh, ky - kh, kx + kh, ky + kh)
+        shapes.append(("oval", (kx - kh, ky - kh, kx + kh, ky + kh), key_width))
         sx1, sy1 = kx + kh, ky
         sx2, sy2 = sx1 + shaft, ky
-        self.canvas.coords(self.items["key_shaft"], sx1, sy1, sx2, sy2)
+        shapes.append(("line", (sx1, sy1, sx2, sy2), key_width))
         t1x = sx2 - 6
         t2x = sx2 - 2
-        self.canvas.coords(self.items["key_tooth1"], t1x, sy2, t1x, sy2 + 5)
-        self.canvas.coords(self.items["key_tooth2"], t2x, sy2, t2x, sy2 + 7)
+        shapes.append(("line", (t1x, sy2, t1x, sy2 + 5), key_width))
+        shapes.append(("line", (t2x, sy2, t2x, sy2 + 7), key_width))
+        return shapes
 
+    def _build_sprite_box(self):
+        """
+        Find the smallest box that holds the figure in every walk pose.
+        
+        Returns:
+            tuple: (left, top, right, bottom) in whole pixels, relative to
+                the figure's anchor point
+        """
+        xs = []
+        ys = []
+        for idx in range(self.PHASE_STEPS):
+            for _kind, coords, _width in self._figure_shapes(idx, key_width=2):
+                xs += coords[0::2]
+                ys += coords[1::2]
+        pad = 3
+        return (math.floor(min(xs)) - pad, math.floor(min(ys)) - pad,
+                math.ceil(max(xs)) + pad, math.ceil(max(ys)) + pad)
+
+    def _render_sprite(self, phase_idx, key_width=1):
+        """
+        Draw one walk pose into a transparent image.
+        
+        The figure is drawn at SPRITE_SUPERSAMPLE times the final size and
+        scaled down, which gives smooth anti-aliased lines.
+        
+        Args:
+            phase_idx (int): Index into the walk-cycle table
+            key_width (int): Outline width for the key
+        
+        Returns:
+            PIL.Image.Image: RGBA sprite the size of _sprite_box
+        """
+        scale = self.SPRITE_SUPERSAMPLE
+        left, top, right, bottom = self._sprite_box
+        size = (right - left, bottom - top)
+        img = Image.new("RGBA", (size[0] * scale, size[1] * scale), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(img)
+        color = self.colors["stick"]
+
+        def to_px(coords):
+            return [((coords[i] - left) * scale, (coords[i + 1] - top) * scale)
+                    for i in range(0, len(coords), 2)]
+
+        for kind, coords, width in self._figure_shapes(phase_idx, key_width):
+            points = to_px(coords)
+            if kind == "oval":
+                draw.ellipse(points, outline=color, width=width * scale)
+            else:
+                draw.line(points, fill=color, width=width * scale)
+                if width > 1:
+                    # Round line caps, like the canvas lines had
+                    r = width * scale / 2
+                    for px, py in points:
+                        draw.ellipse((px - r, py - r, px + r, py + r), fill=color)
+
+        return img.resize(size, Image.Resampling.LANCZOS)
+
+    def _get_sprite(self, phase_idx, key_width=1):
+        """Return the PhotoImage for a pose, rendering it on first use"""
+        key = (phase_idx, key_width)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = ImageTk.PhotoImage(self._render_sprite(phase_idx, key_width), master=self.canvas)
+            self._sprites[key] = sprite
+        return sprite
 
 class HashVerifierGUI:
     """
@@ -393,6 +724,33 @@ class HashVerifierGUI:
     Args:
         master: The root Tk window
     """
+
+    # Terminal scrollback: once it passes TERMINAL_MAX_LINES, the oldest
+    # lines are dropped so TERMINAL_KEEP_LINES remain
+    TERMINAL_MAX_LINES = 5000
+    TERMINAL_KEEP_LINES = 2500
+
+    # Most terminal messages waiting for the next batched flush
+    TERMINAL_PENDING_MAX = 5000
+    # While the terminal is unmapped (window minimized) only re-check this often
+    TERMINAL_HIDDEN_RETRY_MS = 250
+
+    # Every color the terminal is written in: the GUI's own messages and the
+    # short hex colors hash_verifier uses for its status lines
+    TERMINAL_PALETTE = (
+        "#e6d9ff", "#ff6b6b", "#90ee90",
+        "#fff", "#f00", "#0f0", "#0ff", "#ff0",
+    )
+
+    # Worker-to-UI queue pump: drain interval while busy / while idle, and
+    # the most events handled per drain so input events still get a turn
+    UI_PUMP_MS = 16
+    UI_PUMP_IDLE_MS = 100
+    UI_PUMP_MAX_EVENTS = 500
+
+    # Minimum seconds between progress widget updates (~30 per second)
+    PROGRESS_MIN_INTERVAL = 0.033
+
     def __init__(self, master):
         """
         Initialize the main GUI window with all components.
@@ -443,18 +801,34 @@ class HashVerifierGUI:
         # === INITIALIZE DATA ===
         # Progress tracking variables
         self._progress_last_ts = 0.0
-        self._progress_last_frac = 0.0
+        
+        # Latest-wins slot for progress reported by the worker thread
+        self._progress_lock = threading.Lock()
+        self._pending_progress = None
+        self._progress_flush_queued = False
         
         # Terminal performance optimizations
+        # Color -> tag name; the fixed palette is configured up front
         self._terminal_tags_cache = {}
-        self._pending_terminal_updates = []
+        for color in self.TERMINAL_PALETTE:
+            self._create_color_tag(color)
+        # Bounded: if the UI falls far behind, the oldest pending lines are
+        # dropped (and counted) rather than letting the backlog grow
+        self._pending_terminal_updates = deque(maxlen=self.TERMINAL_PENDING_MAX)
+        self._terminal_dropped = 0
         self._terminal_update_scheduled = False
 
         # Worker thread control
         self._stop_event = None
         self._worker_thread = None
 
-        # Load available wordlists
+        # Worker threads never touch Tk directly: they put (callback, args)
+        # on this queue and _pump_ui_queue() runs them on the Tk thread
+        self._ui_queue = queue.SimpleQueue()
+        self.master.after(self.UI_PUMP_MS, self._pump_ui_queue)
+
+        # Load available wordlists in the background, so scanning the folder
+        # never holds up the first paint of the window
         self.load_wordlists()
 
     def get_font(self, family="Arial", size_offset=0, weight="normal"):
@@ -595,31 +969,27 @@ class HashVerifierGUI:
         self.wordlist_frame = Frame(self.left_frame, bg=self.colors["panel"])
         self.wordlist_frame.pack()
 
-        # ttk Scrollbar styles
-        self.style.configure(
-            'Purple.Vertical.TScrollbar',
-            troughcolor=self.colors["panel"],
-            background=self.colors["accent_alt"],
-            arrowcolor=self.colors["text"],
-            bordercolor=self.colors["panel"],
-            lightcolor=self.colors["accent_alt"],
-            darkcolor=self.colors["accent"],
-            arrowsize=12
-        )
-        self.style.map(
-            'Purple.Vertical.TScrollbar',
-            background=[('active', self.colors["accent"]), ('pressed', self.colors["accent"])],
-            arrowcolor=[('disabled', self.colors["muted"])],
-        )
-
+        # Scrollbar uses the Purple.Vertical.TScrollbar style from _setup_styles()
         self.wordlist_scrollbar = ttk.Scrollbar(
             self.wordlist_frame, orient='vertical', style='Purple.Vertical.TScrollbar'
         )
         self.wordlist_scrollbar.pack(side='right', fill='y')
 
+        # Click hit-testing state, kept in Python so clicks need no Tcl queries:
+        # item count, first visible fraction (from yscrollcommand) and the
+        # row geometry (measured on the first click)
+        self._wordlist_count = 0
+        self._wordlist_first = 0.0
+        self._wordlist_line_h = None
+        self._wordlist_inset = 0
+
+        def on_wordlist_scroll(first, last):
+            self._wordlist_first = float(first)
+            self.wordlist_scrollbar.set(first, last)
+
         self.wordlist_box = Listbox(
             self.wordlist_frame, selectmode='multiple',
-            yscrollcommand=self.wordlist_scrollbar.set, width=30, height=18,
+            yscrollcommand=on_wordlist_scroll, width=30, height=18,
             bg=self.colors["entry_bg"], fg=self.colors["entry_fg"],
             selectbackground=self.colors["select_bg"], selectforeground=self.colors["select_fg"],
             takefocus=0  # Prevent the listbox from taking focus
@@ -666,31 +1036,40 @@ class HashVerifierGUI:
         
         self.wordlist_scrollbar.config(command=self.wordlist_box.yview)
         
+        # Row pitch and top inset never change for a given font, so measure
+        # them once from the first visible row
+        def measure_rows():
+            top = self.wordlist_box.nearest(0)
+            bbox = self.wordlist_box.bbox(top)
+            if bbox is None:
+                return False
+            sel_bw = int(self.wordlist_box.cget('selectborderwidth'))
+            # Tk's listbox rows are the font's linespace plus one pixel and
+            # the selection border on both sides; bbox reports the linespace
+            self._wordlist_line_h = bbox[3] + 1 + 2 * sel_bw
+            self._wordlist_inset = bbox[1] - sel_bw
+            return True
+        
         # Simple click handler for proper selection behavior
         def on_mouse_click(event):
-            # Get the item index at click position
-            index = self.wordlist_box.nearest(event.y)
-            
             # Check if there are any items in the listbox
-            if self.wordlist_box.size() == 0:
+            count = self._wordlist_count
+            if count == 0:
                 return
             
-            # Get the bounding box of the item
-            try:
-                bbox = self.wordlist_box.bbox(index)
-                if bbox is None:
-                    # Clicked in empty area below all items
-                    self.wordlist_box.selection_clear(0, END)
-                    return "break"
-                
-                # Check if click Y coordinate is within the item's bounds
-                if event.y < bbox[1] or event.y > bbox[1] + bbox[3]:
-                    # Clicked in empty area - clear selections
-                    self.wordlist_box.selection_clear(0, END)
-                    return "break"
-                    
-            except tk.TclError:
-                # Error getting bbox means empty area
+            if self._wordlist_line_h is None and not measure_rows():
+                return
+            
+            # Work out the row under the click from the cached geometry
+            top = int(round(self._wordlist_first * count))
+            offset = event.y - self._wordlist_inset
+            index = top + offset // self._wordlist_line_h
+            if offset < 0:
+                # Clicked in the top inset above the first row - leave the
+                # selection as it is
+                return "break"
+            if index >= count:
+                # Clicked in empty area below all items - clear selections
                 self.wordlist_box.selection_clear(0, END)
                 return "break"
         
@@ -714,7 +1093,8 @@ class HashVerifierGUI:
         # Load and display the image
         try:
             img_path = os.path.join(os.path.dirname(__file__), "images", "image01.png")
-            # Load image with PIL for high-quality resizing
+            # Only the header is read here; the pixels are resized (or
+            # loaded from the cache) below
             pil_image = Image.open(img_path)
             
             # Get the exact width of the wordlist box (including borders)
@@ -737,11 +1117,8 @@ class HashVerifierGUI:
             # Configure canvas to prevent resizing
             self.image_canvas.pack_propagate(False)
             
-            # Resize image with high-quality antialiasing
-            resized_image = pil_image.resize(
-                (fixed_width, fixed_height),
-                Image.Resampling.LANCZOS
-            )
+            # High-quality LANCZOS resize, cached between launches
+            resized_image = load_resized_image(img_path, (fixed_width, fixed_height))
             
             # Convert PIL image to PhotoImage for tkinter
             self.logo_image = ImageTk.PhotoImage(resized_image)
@@ -811,20 +1188,15 @@ class HashVerifierGUI:
         # Pack with centered positioning instead of filling full width
         self.hash_entry.pack(padx=20, pady=5)
         
-        # Simple placeholder text
-        def update_placeholder():
-            if self.showing_placeholder:
-                self.hash_entry.delete(0, END)
-                self.hash_entry.insert(0, "Double-click to browse file")
-                self.hash_entry.config(fg=self.colors["muted"], justify='center')
-        
-        # Add placeholder text after widget is rendered
-        self.hash_entry.bind('<Configure>', lambda e: self.hash_entry.after_idle(update_placeholder))
-        # Initial placeholder
-        self.hash_entry.after(10, update_placeholder)
-        
-        # Track if we're showing placeholder
+        # Track if we're showing placeholder, and which look ("placeholder" or
+        # "user") the entry currently has so fg/justify are only reconfigured
+        # when it actually changes
         self.showing_placeholder = True
+        self._entry_visual_state = None
+        
+        # Initial placeholder once the widget is rendered; after that it is
+        # only restored on focus-out, never on every <Configure>
+        self.hash_entry.after(10, self._update_placeholder)
         
         # Bind events for placeholder behavior
         def hash_entry_double_click(event):
@@ -901,11 +1273,18 @@ class HashVerifierGUI:
 
         self.terminal = Text(
             self.terminal_content, height=15, width=60, wrap='word',
-            yscrollcommand=self.terminal_scrollbar.set, state=DISABLED,
+            yscrollcommand=self.terminal_scrollbar.set,
+            # Output-only widget: no undo history to record on every insert
+            undo=False, autoseparators=False, maxundo=0, blockcursor=False,
+            insertwidth=0,  # no caret, as it would have when disabled
             bg=self.colors["terminal_bg"], fg=self.colors["terminal_fg"]
         )
         self.terminal.pack(side='left', fill='both', expand=True)
         self.terminal_scrollbar.config(command=self.terminal.yview)
+        # Bound Tcl call and widget path for the hot insert in _insert_terminal_runs
+        self._tk_call = self.terminal.tk.call
+        self._tk_w = self.terminal._w
+        self._make_terminal_readonly()
 
         # Progress widget
         self.progress = StickFigureKeyLockProgress(self.right_frame, width=820, height=160, 
@@ -927,91 +1306,152 @@ class HashVerifierGUI:
 
         # Progress update throttling state
         self._progress_last_ts = 0.0
-        self._progress_last_frac = 0.0
 
     def on_drop_hash(self, event):
         try:
-            file_path = event.data.strip("{}")  # handles spaces in file paths
-            
-            # Validate that the file exists
-            if not os.path.exists(file_path):
-                self.append_terminal(f"Error: File not found - {file_path}", color="#ff6b6b")
-                return
-            
-            # Check if it's a file (not a directory)
-            if not os.path.isfile(file_path):
-                self.append_terminal(f"Error: Not a file - {file_path}", color="#ff6b6b")
+            # Tk hands over a Tcl list (braces around paths with spaces);
+            # only one hash file can be used, so take the first
+            file_paths = self.master.tk.splitlist(event.data)
+            if not file_paths:
                 return
             
-            # Update the entry field
-            self.hash_entry.delete(0, END)
-            self.hash_entry.insert(0, file_path)
-            self.hash_entry.config(fg=self.colors["entry_fg"], justify='left')
-            self.showing_placeholder = False
-            
-            # Show success feedback in terminal
-            filename = os.path.basename(file_path)
-            self.append_terminal(f"Hash file imported: {filename}", color="#90ee90")
+            # Stat the file off the Tk thread (slow on network mounts)
+            threading.Thread(target=self._check_dropped_hash_file,
+                             args=(file_paths[0],), daemon=True).start()
             
         except Exception as e:
             # Show error feedback in terminal
             self.append_terminal(f"Error importing hash file: {str(e)}", color="#ff6b6b")
 
-    def on_drop_wordlist(self, event):
-        """Handle drag and drop for wordlist files"""
+    def _check_dropped_hash_file(self, file_path):
+        # Worker thread: validate the dropped path, then hand it to the Tk thread
         try:
-            file_path = event.data.strip("{}")  # handles spaces in file paths
-            
             # Validate that the file exists
             if not os.path.exists(file_path):
-                self.append_terminal(f"Error: Wordlist file not found - {file_path}", color="#ff6b6b")
+                self._threadsafe_append_terminal(f"Error: File not found - {file_path}", color="#ff6b6b")
                 return
             
             # Check if it's a file (not a directory)
             if not os.path.isfile(file_path):
-                self.append_terminal(f"Error: Not a file - {file_path}", color="#ff6b6b")
+                self._threadsafe_append_terminal(f"Error: Not a file - {file_path}", color="#ff6b6b")
                 return
             
-            # Import the wordlist using the existing import functionality
-            import shutil
+            self._post_to_ui(self._set_dropped_hash_file, file_path)
             
+        except Exception as e:
+            self._threadsafe_append_terminal(f"Error importing hash file: {str(e)}", color="#ff6b6b")
+
+    def _set_dropped_hash_file(self, file_path):
+        """
+        Put a validated, dropped hash file into the entry field.
+        
+        Args:
+            file_path (str): Path of the dropped hash file
+        """
+        # Update the entry field
+        self.hash_entry.delete(0, END)
+        self.hash_entry.insert(0, file_path)
+        self._set_entry_visual_state("user")
+        self.showing_placeholder = False
+        
+        # Show success feedback in terminal
+        filename = os.path.basename(file_path)
+        self.append_terminal(f"Hash file imported: {filename}", color="#90ee90")
+
+    def on_drop_wordlist(self, event):
+        """Handle drag and drop for wordlist files (one or several at once)"""
+        try:
+            # Tk hands over a Tcl list; splitlist parses it in one C call and
+            # handles braces around paths with spaces
+            file_paths = self.master.tk.splitlist(event.data)
+            if not file_paths:
+                return
+            
+            # Copying a large wordlist can take seconds - keep it off the Tk thread
+            self.append_terminal("Importing wordlist...", color="#e6d9ff")
+            threading.Thread(target=self._import_dropped_wordlists,
+                             args=(file_paths,), daemon=True).start()
+
+        except Exception as e:
+            # Show error feedback in terminal
+            self.append_terminal(f"Error importing wordlist via drag & drop: {str(e)}", color="#ff6b6b")
+
+    def _import_dropped_wordlists(self, file_paths):
+        # Worker thread: validate and copy the dropped files, then have the
+        # Tk thread reload the list once for the whole drop
+        try:
             # Get the wordlists directory path
             wordlists_dir = os.path.join(os.path.dirname(__file__), "wordlists")
             
             # Ensure wordlists directory exists
             os.makedirs(wordlists_dir, exist_ok=True)
             
-            # Get the filename from the path
-            filename = os.path.basename(file_path)
-            destination = os.path.join(wordlists_dir, filename)
-            
-            # Check if file already exists
-            if os.path.exists(destination):
-                # Add a timestamp to make it unique
-                import time
-                timestamp = int(time.time())
-                name, ext = os.path.splitext(filename)
-                filename = f"{name}_{timestamp}{ext}"
+            imported = []
+            for file_path in file_paths:
+                # Validate that the file exists
+                if not os.path.exists(file_path):
+                    self._threadsafe_append_terminal(f"Error: Wordlist file not found - {file_path}", color="#ff6b6b")
+                    continue
+                
+                # Check if it's a file (not a directory)
+                if not os.path.isfile(file_path):
+                    self._threadsafe_append_terminal(f"Error: Not a file - {file_path}", color="#ff6b6b")
+                    continue
+                
+                # Get the filename from the path
+                filename = os.path.basename(file_path)
                 destination = os.path.join(wordlists_dir, filename)
+                
+                # Check if file already exists
+                if os.path.exists(destination):
+                    # Add a timestamp to make it unique
+                    timestamp = int(time.time())
+                    name, ext = os.path.splitext(filename)
+                    filename = f"{name}_{timestamp}{ext}"
+                    destination = os.path.join(wordlists_dir, filename)
+                
+                # Copy the file
+                copy_file(file_path, destination)
+                imported.append(filename)
             
-            # Copy the file
-            shutil.copy2(file_path, destination)
-            
-            # Reload the wordlist display
-            self.reload_wordlists()
-            
-            # Show success message in terminal
-            self.append_terminal(f"Wordlist imported: {filename}", color="#90ee90")
+            if imported:
+                # Reload the wordlist display once for the whole drop
+                self._post_to_ui(self.reload_wordlists)
+                
+                # Show success message in terminal
+                for filename in imported:
+                    self._threadsafe_append_terminal(f"Wordlist imported: {filename}", color="#90ee90")
 
         except Exception as e:
             # Show error feedback in terminal
-            self.append_terminal(f"Error importing wordlist via drag & drop: {str(e)}", color="#ff6b6b")
+            self._threadsafe_append_terminal(f"Error importing wordlist via drag & drop: {str(e)}", color="#ff6b6b")
+
+    def _set_entry_visual_state(self, state):
+        """Switch the hash entry between its placeholder and user looks
+        
+        Args:
+            state: "placeholder" (muted, centered) or "user" (normal, left)
+        """
+        if self._entry_visual_state == state:
+            return
+        if state == "placeholder":
+            self.hash_entry.config(fg=self.colors["muted"], justify='center')
+        else:
+            self.hash_entry.config(fg=self.colors["entry_fg"], justify='left')
+        self._entry_visual_state = state
+
+    def _update_placeholder(self):
+        """Show the placeholder text if the entry is in placeholder mode"""
+        if self.showing_placeholder:
+            self.hash_entry.delete(0, END)
+            self.hash_entry.insert(0, "Double-click to browse file")
+            self._set_entry_visual_state("placeholder")
 
     def _on_entry_focus_in(self, event):
         """Handle entry field focus in - clear placeholder text"""
         if self.showing_placeholder:
             self.hash_entry.delete(0, END)
-            self.hash_entry.config(fg=self.colors["entry_fg"], justify='left')
+            self._set_entry_visual_state("user")
             self.showing_placeholder = False
 
     def _on_entry_focus_out(self, event):
@@ -1019,11 +1459,7 @@ class HashVerifierGUI:
         if not self.hash_entry.get().strip():
             self.showing_placeholder = True
             # Trigger the placeholder update
-            self.hash_entry.after_idle(lambda: (
-                self.hash_entry.delete(0, END),
-                self.hash_entry.insert(0, "Double-click to browse file"),
-                self.hash_entry.config(fg=self.colors["muted"], justify='center')
-            ))
+            self.hash_entry.after_idle(self._update_placeholder)
 
     def browse_hash_file(self):
         file_path = filedialog.askopenfilename(
@@ -1033,7 +1469,7 @@ class HashVerifierGUI:
         if file_path:
             self.hash_entry.delete(0, END)
             self.hash_entry.insert(0, file_path)
-            self.hash_entry.config(fg=self.colors["entry_fg"], justify='left')
+            self._set_entry_visual_state("user")
             self.showing_placeholder = False
 
     def import_wordlist(self):
@@ -1049,7 +1485,6 @@ class HashVerifierGUI:
         )
         if file_path:
             try:
-                import shutil
                 # Get the wordlists directory path
                 wordlists_dir = os.path.join(os.path.dirname(__file__), "wordlists")
                 
@@ -1070,7 +1505,7 @@ class HashVerifierGUI:
                     destination = os.path.join(wordlists_dir, filename)
                 
                 # Copy the file
-                shutil.copy2(file_path, destination)
+                copy_file(file_path, destination)
                 
                 # Reload the wordlist display
                 self.reload_wordlists()
@@ -1084,29 +1519,42 @@ class HashVerifierGUI:
 
     def reload_wordlists(self):
         """Reload the wordlist display"""
-        # Clear current items
-        self.wordlist_box.delete(0, END)
-        
-        # Reload wordlists
-        self.load_wordlists()
-        
-        # Update tooltip visibility
-        if hasattr(self, '_update_wordlist_tooltip'):
-            self._update_wordlist_tooltip()
+        # The box is cleared and refilled in one go once the scan is done
+        self.load_wordlists(replace=True)
 
-    def load_wordlists(self):
+    def load_wordlists(self, replace=False):
         """
         Load and display all available wordlists in the selection box.
         
-        This method scans the wordlists directory and populates the
-        wordlist selection box with all available .txt files. It also
-        updates tooltip visibility for user guidance.
+        This method scans the wordlists directory on a background thread
+        and then populates the wordlist selection box with all available
+        .txt files on the Tk thread. It also updates tooltip visibility for
+        user guidance.
         
-        Called during initialization and after importing new wordlists.
+        Args:
+            replace (bool): Clear the current items before adding the new ones
         """
+        threading.Thread(target=self._load_wordlists_async, args=(replace,), daemon=True).start()
+
+    def _load_wordlists_async(self, replace):
+        # Worker thread: scan the folder, then hand the names to the Tk thread
         wordlists = get_available_wordlists()
-        for wordlist in wordlists:
-            self.wordlist_box.insert(END, wordlist)
+        self._post_to_ui(self._populate_wordlist_box, wordlists, replace)
+
+    def _populate_wordlist_box(self, wordlists, replace=False):
+        """
+        Add wordlist names to the selection box in one bulk insert.
+        
+        Args:
+            wordlists (list): Wordlist file names to display
+            replace (bool): Clear the current items first
+        """
+        if replace:
+            self.wordlist_box.delete(0, END)
+            self._wordlist_count = 0
+        if wordlists:
+            self.wordlist_box.insert(END, *wordlists)
+            self._wordlist_count += len(wordlists)
         
         # Update tooltip visibility after loading
         if hasattr(self, '_update_wordlist_tooltip'):
@@ -1116,7 +1564,9 @@ class HashVerifierGUI:
         """
         Optimized terminal append with tag caching and batched updates.
         """
-        # Add to pending updates for batching
+        # Add to pending updates for batching (a full deque drops its oldest)
+        if len(self._pending_terminal_updates) == self.TERMINAL_PENDING_MAX:
+            self._terminal_dropped += 1
         self._pending_terminal_updates.append((text, replace_last, color, segments))
         
         # Schedule batch update if not already scheduled
@@ -1131,46 +1581,135 @@ class HashVerifierGUI:
         if not self._pending_terminal_updates:
             self._terminal_update_scheduled = False
             return
-            
-        self.terminal.config(state=NORMAL)
         
-        # Process all pending updates
-        for text, replace_last, color, segments in self._pending_terminal_updates:
+        # Text still lays out inserts while unmapped; keep buffering in the
+        # (bounded) deque and flush everything in one go once it is visible
+        if not self.terminal.winfo_viewable():
+            self.master.after(self.TERMINAL_HIDDEN_RETRY_MS, self._process_terminal_updates)
+            return
+        
+        # Only follow the output if the user hasn't scrolled up to read it
+        at_bottom = self.terminal.yview()[1] >= 0.999
+        
+        # Collect the text as runs of (tag, chunks), merging neighbours that
+        # share a tag, so the whole batch goes to Tk in as few inserts as possible
+        runs = []
+        
+        def add_text(chunk, tag_name):
+            if runs and runs[-1][0] == tag_name:
+                runs[-1][1].append(chunk)
+            else:
+                runs.append((tag_name, [chunk]))
+        
+        # Locals for the loop below, which can run thousands of times per flush
+        pending = self._pending_terminal_updates
+        popleft = pending.popleft
+        get_tag = self._get_or_create_tag
+        
+        if self._terminal_dropped:
+            add_text(f"… {self._terminal_dropped} earlier lines skipped to keep up …\n",
+                     get_tag("#ff6b6b"))
+            self._terminal_dropped = 0
+        
+        # Process all pending updates (popping, so nothing appended meanwhile is lost)
+        while pending:
+            text, replace_last, color, segments = popleft()
             if replace_last:
+                # The line to replace may still be in runs - write those out first
+                self._insert_terminal_runs(runs)
+                runs.clear()
                 last_line_idx = self.terminal.index("end-2l")
                 self.terminal.delete(last_line_idx, "end-1l")
                 
             if segments:
                 for seg_text, seg_color in segments:
-                    tag_name = self._get_or_create_tag(seg_color)
-                    self.terminal.insert(END, seg_text, tag_name)
-                self.terminal.insert(END, "\n")
+                    add_text(seg_text, get_tag(seg_color))
+                # Keep the newline in the last segment's run
+                add_text("\n", runs[-1][0] if runs else ())
             else:
-                tag_name = self._get_or_create_tag(color)
-                self.terminal.insert(END, text + "\n", tag_name)
+                add_text(text + "\n", get_tag(color))
+        
+        self._insert_terminal_runs(runs)
+        
+        # Bound the scrollback so long runs don't grow the widget forever
+        line_count = int(self.terminal.index("end-1c").split(".")[0])
+        if line_count > self.TERMINAL_MAX_LINES:
+            self.terminal.delete("1.0", f"{line_count - self.TERMINAL_KEEP_LINES + 1}.0")
         
-        # Clear pending updates
-        self._pending_terminal_updates.clear()
         self._terminal_update_scheduled = False
         
         # Single scroll and state update for all messages
-        self.terminal.see(END)
-        self.terminal.config(state=DISABLED)
+        if at_bottom:
+            self.terminal.see(END)
+
+    def _insert_terminal_runs(self, runs):
+        """
+        Append (tag, chunks) runs to the terminal with a single Tcl insert call.
+        
+        Args:
+            runs (list): (tag_name, list of text chunks) pairs, in order
+        """
+        if not runs:
+            return
+        args = [self._tk_w, "insert", "end"]
+        for tag_name, chunks in runs:
+            args += ["".join(chunks), tag_name]
+        # Straight to Tcl, skipping the Text.insert wrapper's tuple building
+        self._tk_call(*args)
+
+    # Keys that only move the view or copy, which the read-only terminal allows
+    TERMINAL_NAV_KEYS = frozenset(("Up", "Down", "Left", "Right", "Prior", "Next", "Home", "End"))
+
+    def _make_terminal_readonly(self):
+        """
+        Block user edits on the terminal while leaving its state NORMAL.
+        
+        Instance bindings run before the Text class ones, so breaking here
+        stops typing and pasting but keeps selection, copy and scrolling,
+        and the flush no longer has to toggle the widget state.
+        """
+        # Control is 0x4 everywhere; 0x8 is Command only on aqua (on Windows
+        # it is NumLock, which would let plain keys through)
+        command_mask = 0x4
+        if self.terminal.tk.call('tk', 'windowingsystem') == 'aqua':
+            command_mask |= 0x8
+        
+        def on_key(event):
+            if event.keysym in self.TERMINAL_NAV_KEYS:
+                return None
+            # Control-c / Control-a / Control-slash (copy, select all)
+            if event.state & command_mask and event.keysym.lower() in ("c", "a", "slash"):
+                return None
+            return "break"
+        
+        self.terminal.bind('<Key>', on_key)
+        for virtual_event in ('<<Paste>>', '<<Cut>>', '<<Clear>>', '<<PasteSelection>>'):
+            self.terminal.bind(virtual_event, lambda e: "break")
 
     def _get_or_create_tag(self, color):
         """
-        Get cached color tag or create new one. Significant performance improvement
-        over creating tags repeatedly for the same colors.
+        Get the terminal tag for a color. The palette's tags are created at
+        startup, so this is normally a single dict lookup.
         """
-        tag_name = f"color_{color.lstrip('#')}"
+        tag_name = self._terminal_tags_cache.get(color)
+        if tag_name is None:
+            tag_name = self._create_color_tag(color)
+        return tag_name
+
+    def _create_color_tag(self, color):
+        """
+        Configure a foreground-color tag on the terminal and cache it.
         
-        # Check cache first (O(1) lookup)
-        if tag_name not in self._terminal_tags_cache:
-            # Create tag only if it doesn't exist
-            if tag_name not in self.terminal.tag_names():
-                self.terminal.tag_configure(tag_name, foreground=color)
-            self._terminal_tags_cache[tag_name] = True
-            
+        Args:
+            color (str): Tk color, e.g. "#90ee90"
+        
+        Returns:
+            str: The tag name
+        """
+        tag_name = f"color_{color.lstrip('#')}"
+        # tag_configure is idempotent, so no need to check tag_names() first
+        self.terminal.tag_configure(tag_name, foreground=color)
+        self._terminal_tags_cache[color] = tag_name
         return tag_name
 
     def clear_terminal(self):
@@ -1179,45 +1718,33 @@ class HashVerifierGUI:
         """
         # Clear any pending updates first
         self._pending_terminal_updates.clear()
+        self._terminal_dropped = 0
         self._terminal_update_scheduled = False
         
         # Clear terminal content efficiently
-        self.terminal.config(state=NORMAL)
         self.terminal.delete("1.0", END)
         self.terminal.see(END)
-        self.terminal.config(state=DISABLED)
         
-        # Reset tag cache for clean state
-        self._terminal_tags_cache.clear()
+        # Tags survive deleting the text, so the tag cache stays valid
 
     def update_progress(self, value, maximum):
         """
-        Optimized progress update with better throttling and reduced UI calls.
+        Progress update with a coarse time gate. The progress widget itself
+        skips label and figure updates that would not change what is shown.
         """
         try:
             maxv = float(maximum) if float(maximum) > 0 else 1.0
             frac = min(1.0, max(0.0, float(value) / maxv))
             now = time.monotonic()
             
-            # Enhanced throttling: only update if significant change or enough time passed
-            if frac < 1.0:
-                time_diff = now - self._progress_last_ts
-                frac_diff = frac - self._progress_last_frac
-                
-                # More aggressive throttling: require either significant time OR significant progress
-                if time_diff < 0.1 and frac_diff < 0.02:
-                    return
-                    
+            # Always let the final 100% through
+            if frac < 1.0 and now - self._progress_last_ts < self.PROGRESS_MIN_INTERVAL:
+                return
             self._progress_last_ts = now
-            self._progress_last_frac = frac
             
-            # Single progress update
+            # Single progress update; Tk repaints the canvas on its next idle
+            # pass, so there is no need to force a synchronous redraw here
             self.progress.set(frac * 100.0)
-            
-            # Reduce update_idletasks calls - only when necessary
-            if frac >= 1.0 or (now - getattr(self, '_last_ui_update', 0)) > 0.2:
-                self.master.update_idletasks()
-                self._last_ui_update = now
                 
         except Exception:
             pass
@@ -1236,8 +1763,9 @@ class HashVerifierGUI:
         the GUI responsive while processing potentially large wordlists.
         """
         hash_value = self.hash_entry.get()
-        selected_indices = self.wordlist_box.curselection()
-        selected_wordlists = [self.wordlist_box.get(i) for i in selected_indices]
+        # Two Tcl round trips regardless of selection size
+        all_items = self.wordlist_box.get(0, END)
+        selected_wordlists = [all_items[i] for i in self.wordlist_box.curselection()]
 
         if not hash_value:
             self.append_terminal("Input Error: Please enter a hash value or path to a hash file.")
@@ -1254,7 +1782,6 @@ class HashVerifierGUI:
         # Ensure any previous 'stopped' banner is hidden at start
         self._show_stopped_banner(False)
         self._progress_last_ts = 0.0
-        self._progress_last_frac = 0.0
         self.progress.reset()
         self.progress.start()
         self._stop_event = threading.Event()
@@ -1315,7 +1842,8 @@ class HashVerifierGUI:
             # Optimized: batch button state changes
             self._update_button_states(verify_enabled=True, stop_enabled=False)
             self._worker_thread = None
-        self.master.after(0, finish)
+        # Queued behind the worker's last messages, so it always runs after them
+        self._post_to_ui(finish)
 
     def stop_verification(self):
         """
@@ -1333,10 +1861,52 @@ class HashVerifierGUI:
             self.append_terminal("Stopping… letting current iteration finish.")
             self._show_stopped_banner(False)
 
+    def _post_to_ui(self, callback, *args):
+        # Safe from any thread: queue a call for the Tk main loop
+        self._ui_queue.put((callback, args))
+
+    def _pump_ui_queue(self):
+        """
+        Run queued worker-thread calls on the Tk thread, then reschedule.
+        
+        One timer drains everything the workers queued since the last run,
+        instead of a separate after(0) callback per message.
+        """
+        handled = 0
+        try:
+            while handled < self.UI_PUMP_MAX_EVENTS:
+                try:
+                    callback, args = self._ui_queue.get_nowait()
+                except queue.Empty:
+                    break
+                handled += 1
+                try:
+                    callback(*args)
+                except Exception as e:
+                    print(f"Error in UI callback: {e}")
+        finally:
+            busy = handled or self._worker_thread is not None
+            self.master.after(self.UI_PUMP_MS if busy else self.UI_PUMP_IDLE_MS, self._pump_ui_queue)
+
     def _threadsafe_append_terminal(self, text, replace_last=False, color="#e6d9ff", segments=None):
         # Marshal text updates safely to the Tk main loop
-        self.master.after(0, self.append_terminal, text, replace_last, color, segments)
+        self._post_to_ui(self.append_terminal, text, replace_last, color, segments)
 
     def _threadsafe_update_progress(self, value, maximum):
-        # Marshal progress updates safely to the Tk main loop
-        self.master.after(0, self.update_progress, value, maximum)
\ No newline at end of file
+        # Only the newest progress value is ever shown, so keep just that one
+        # and have at most one flush waiting in the UI queue
+        with self._progress_lock:
+            self._pending_progress = (value, maximum)
+            if self._progress_flush_queued:
+                return
+            self._progress_flush_queued = True
+        self._post_to_ui(self._flush_progress)
+
+    def _flush_progress(self):
+        # Tk thread: apply the latest progress reported by the worker
+        with self._progress_lock:
+            pending = self._pending_progress
+            self._pending_progress = None
+            self._progress_flush_queued = False
+        if pending is not None:
+            self.update_progress(*pending)
\ No newline at end of file
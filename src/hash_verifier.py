@@ -7,32 +7,18 @@ This file contains the core logic for checking if hashes match common passwords.
 How it works:
 1. Takes a hash (encrypted password) as input
 2. Tries different hash algorithms based on the hash length
-3. Checks each word in the selected wordlists b                # Skip remaining wordlists for this algorithm if we found all hashes in this length group
-                if found_in_group[hash_length] == len(hashes_in_group):
-                    send_status_message(
-                        "",
-                        False,
-                        "#0f0",
-                        [
-                            ("✅ Found all ", "#0f0"),
-                            (str(len(hashes_in_group)), "#fff"),
-                            (" hashes for ", "#0f0"),
-                            (f"{hash_length}-char", "#ff0"),
-                            (" length using ", "#0f0"),
-                            (algorithm, "#0ff"),
-                        ]
-                    )
-                    breakshing it
+3. Checks each word in the selected wordlists by hashing it
 4. If the hashed word matches the input hash, we found the password!
 
 Performance Optimizations:
 - Early termination when ALL hashes in a list are found
-- O(1) hash lookup using sets instead of O(n) list searches
+- O(1) hash lookup using sets of raw digests instead of hex strings
 - Cached hasher objects to avoid repeated object creation
 - Duplicate password detection to skip already-tested combinations
 - Smart algorithm ordering (most common first: MD5, SHA1, SHA256)
-- Efficient file I/O with single-pass reading
-- Per-algorithm group completion detection
+- Each wordlist read once (as bytes) and checked against all algorithms
+- Per-length-group completion detection
+- Large wordlists split across CPU cores
 
 This helps people understand if their passwords are too common and easily guessable.
 """
@@ -40,7 +26,11 @@ This helps people understand if their passwords are too common and easily guessa
 # Import the modules we need
 import os
 import hashlib
-from collections import defaultdict
+import multiprocessing
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from typing import Dict, List, Tuple, Optional, Callable, Any
 
 # This dictionary maps hash lengths to the algorithms that produce them
@@ -58,6 +48,43 @@ HASH_ALGORITHMS_BY_LENGTH = {
 # Find the wordlists folder (should be in the same directory as this file)
 WORDLISTS_FOLDER = os.path.join(os.path.dirname(__file__), "wordlists")
 
+# Seconds between progress reports to the GUI (~15 per second); the clock
+# itself is only read every 4096 lines
+PROGRESS_REPORT_INTERVAL = 0.066
+
+# Raw contents of recently used wordlists are kept between runs, up to this
+# many bytes in total (least recently used dropped first); a file bigger
+# than the whole budget is simply re-read every run
+WORDLIST_CACHE_BUDGET_BYTES = 64 * 1024 * 1024
+
+# (realpath, st_mtime_ns, st_size) -> file contents, oldest first
+_wordlist_cache = OrderedDict()
+_wordlist_cache_bytes = 0
+_wordlist_cache_lock = threading.Lock()
+
+# Empty hasher per algorithm, created on first use and kept for the life of
+# the process; every password hash starts as a copy() of one of these
+_HASHER_TEMPLATES = {}
+
+
+def get_hasher_template(algorithm):
+    """
+    Returns the shared, empty hasher object for an algorithm.
+    
+    Args:
+        algorithm (str): hashlib algorithm name (like "sha256")
+    
+    Returns:
+        hashlib object: Never updated itself - copy() it before hashing
+    
+    Raises:
+        ValueError: If OpenSSL can't provide the algorithm (like hashlib.new)
+    """
+    hasher = _HASHER_TEMPLATES.get(algorithm)
+    if hasher is None:
+        hasher = _HASHER_TEMPLATES[algorithm] = hashlib.new(algorithm)
+    return hasher
+
 
 def get_available_wordlists():
     """
@@ -79,6 +106,50 @@ def get_available_wordlists():
     return txt_files
 
 
+def load_wordlist_lines(wordlist_path):
+    """
+    Reads a wordlist as raw bytes lines (not decoded, line endings removed).
+    
+    The raw contents of small files are cached (see
+    WORDLIST_CACHE_BUDGET_BYTES), so checking another hash against the same
+    wordlists doesn't read them again; only the split is redone, which keeps
+    the cache to one bytes object per file. The cache is keyed by
+    modification time and size, so an edited file is picked up.
+    
+    Args:
+        wordlist_path (str): Full path to the wordlist file
+    
+    Returns:
+        sequence: One bytes object per line
+    """
+    global _wordlist_cache_bytes
+    file_info = os.stat(wordlist_path)
+    if file_info.st_size > WORDLIST_CACHE_BUDGET_BYTES:
+        return _read_wordlist(wordlist_path).splitlines()
+    
+    key = (os.path.realpath(wordlist_path), file_info.st_mtime_ns, file_info.st_size)
+    with _wordlist_cache_lock:
+        contents = _wordlist_cache.get(key)
+        if contents is not None:
+            _wordlist_cache.move_to_end(key)
+    if contents is None:
+        contents = _read_wordlist(wordlist_path)
+        with _wordlist_cache_lock:
+            if key not in _wordlist_cache:
+                _wordlist_cache[key] = contents
+                _wordlist_cache_bytes += len(contents)
+                while _wordlist_cache_bytes > WORDLIST_CACHE_BUDGET_BYTES:
+                    _, evicted = _wordlist_cache.popitem(last=False)
+                    _wordlist_cache_bytes -= len(evicted)
+    # A C-level split; hashlib wants bytes anyway
+    return contents.splitlines()
+
+
+def _read_wordlist(wordlist_path):
+    with open(wordlist_path, "rb") as file:
+        return file.read()
+
+
 def create_hash(word, hasher):
     """
     Creates a hash of a word using a pre-configured hasher object (for efficiency).
@@ -96,6 +167,91 @@ def create_hash(word, hasher):
     return hasher_copy.hexdigest()
 
 
+# Worker processes for splitting large wordlists (hashlib holds the GIL for
+# short inputs, so threads wouldn't help); below PARALLEL_MIN_HASHES hash
+# operations for a wordlist, starting the workers costs more than it saves
+PROCESS_POOL_WORKERS = os.cpu_count() or 1
+PARALLEL_MIN_HASHES = 2_000_000
+
+# How long to wait on the workers before checking for a stop request
+POOL_POLL_SECONDS = 0.1
+
+
+def _hash_chunk(passwords, search_specs):
+    """
+    Process-pool worker: hashes passwords with every algorithm in the specs.
+    
+    Args:
+        passwords (list): Unique, stripped bytes passwords
+        search_specs (list): (hash_length, algorithm, frozenset of target digests)
+    
+    Returns:
+        tuple: (number of passwords checked, list of
+                (hash_length, algorithm, password, digest) matches)
+    """
+    specs = [(hash_length, algorithm, get_hasher_template(algorithm).copy, targets)
+             for hash_length, algorithm, targets in search_specs]
+    hits = []
+    for password in passwords:
+        for hash_length, algorithm, new_hasher, targets in specs:
+            password_hasher = new_hasher()
+            password_hasher.update(password)
+            password_digest = password_hasher.digest()
+            if password_digest in targets:
+                hits.append((hash_length, algorithm, password, password_digest))
+    return len(passwords), hits
+
+
+def _create_process_pool():
+    """
+    Starts the worker processes for one verify_hash run.
+    
+    "spawn" because forking a process running Tk is unsafe; the workers
+    only import hash_verifier (see main.py). The pool is shared by all
+    large wordlists of the run, so the workers start once per run.
+    
+    Returns:
+        ProcessPoolExecutor: Shut it down when the run is over
+    """
+    context = multiprocessing.get_context("spawn")
+    return ProcessPoolExecutor(max_workers=PROCESS_POOL_WORKERS, mp_context=context)
+
+
+def _search_in_processes(pool, passwords, search_specs):
+    """
+    Hashes passwords across the worker processes of a pool.
+    
+    A generator: yields one _hash_chunk result per finished chunk, in
+    completion order, and (0, []) whenever POOL_POLL_SECONDS pass without
+    one, so the caller can check for a stop request. Closing it early
+    (stop, or everything found) cancels the chunks that haven't started;
+    the running ones are small and just finish.
+    
+    Args:
+        pool (ProcessPoolExecutor): From _create_process_pool()
+        passwords (list): Unique, stripped bytes passwords
+        search_specs (list): (hash_length, algorithm, frozenset of target digests)
+    
+    Yields:
+        tuple: (number of passwords checked, list of matches)
+    """
+    # Many small chunks per worker so progress and stop requests come
+    # through regularly, and little work is left running after an early exit
+    chunk_size = max(5_000, -(-len(passwords) // (PROCESS_POOL_WORKERS * 16)))
+    pending = {pool.submit(_hash_chunk, passwords[start:start + chunk_size], search_specs)
+               for start in range(0, len(passwords), chunk_size)}
+    try:
+        while pending:
+            done, pending = wait(pending, timeout=POOL_POLL_SECONDS, return_when=FIRST_COMPLETED)
+            if not done:
+                yield 0, []
+            for future in done:
+                yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
 def verify_hash(hash_to_check, wordlist_names, gui_callback=None, progress_callback=None, stop_event=None):
     """
     The main function that tries to find what password created a given hash.
@@ -145,9 +301,6 @@ def verify_hash(hash_to_check, wordlist_names, gui_callback=None, progress_callb
         # It's a single hash
         hash_list = [hash_to_check]
 
-    # Convert all hashes to lowercase for consistent comparison and use sets for O(1) lookup
-    hash_list = [hash_value.lower() for hash_value in hash_list]
-
     # Group hashes by their length (different lengths need different algorithms)
     # Use sets for O(1) lookup performance instead of lists
     hashes_by_length = defaultdict(set)
@@ -155,20 +308,55 @@ def verify_hash(hash_to_check, wordlist_names, gui_callback=None, progress_callb
         length = len(hash_value)
         hashes_by_length[length].add(hash_value)
 
-    # Keep track of passwords we've already tested to avoid duplicates
-    tested_passwords = set()
+    # Resolve each wordlist's path (and check it exists) once up front -
+    # the loops below revisit every wordlist for each hash length and algorithm
+    wordlist_paths = []
+    wordlist_sizes = {}
+    for wordlist_name in wordlist_names:
+        wordlist_path = os.path.join(WORDLISTS_FOLDER, wordlist_name)
+        if os.path.isfile(wordlist_path):
+            wordlist_paths.append((wordlist_name, wordlist_path))
+            wordlist_sizes[wordlist_path] = os.path.getsize(wordlist_path)
+        else:
+            send_status_message(
+                "",
+                False,
+                "#f00",
+                [
+                    ("Wordlist not found: ", "#f00"),
+                    (wordlist_name, "#e6d9ff"),
+                ]
+            )
     
-    # Track how many hashes we've found for each length group
-    found_in_group = defaultdict(int)
+    # Smallest wordlists first: they tend to hold the most common passwords,
+    # so when everything is found early the big lists are never read
+    wordlist_paths.sort(key=lambda entry: wordlist_sizes[entry[1]])
 
-    # Process each group of hashes (by length)
+    # Work out once which algorithms to try for which targets. Each entry is
+    # (hash_length, algorithm, hasher, target_digests); the digest set of a
+    # length group is shared by all of its algorithms.
+    search_plan = []
+    group_sizes = {}
     for hash_length, hashes_in_group in hashes_by_length.items():
         
         # Check if we know what algorithms can produce this hash length
         if hash_length not in HASH_ALGORITHMS_BY_LENGTH:
-            send_status_message(f"Unknown hash length: {hash_length} characters (hash: {hashes_in_group[0]})")
+            send_status_message(f"Unknown hash length: {hash_length} characters (hash: {next(iter(hashes_in_group))})")
             continue
 
+        # Compare raw digests rather than hex strings: half the bytes, and no
+        # hex string is built per password (hex is only needed for results).
+        # fromhex accepts either case, so the hashes need no lowercasing.
+        target_digests = set()
+        for hash_value in hashes_in_group:
+            try:
+                target_digests.add(bytes.fromhex(hash_value))
+            except ValueError:
+                send_status_message(f"Not a valid hex hash, skipping: {hash_value}")
+        if not target_digests:
+            continue
+        group_sizes[hash_length] = len(target_digests)
+
         # Get the possible algorithms for this hash length
         possible_algorithms = HASH_ALGORITHMS_BY_LENGTH[hash_length]
         send_status_message(
@@ -181,14 +369,7 @@ def verify_hash(hash_to_check, wordlist_names, gui_callback=None, progress_callb
             ]
         )
 
-        # Try each possible algorithm
         for algorithm in possible_algorithms:
-            
-            # Check if we should stop early
-            if stop_event is not None and getattr(stop_event, "is_set", lambda: False)():
-                was_stopped_early = True
-                break
-                
             # Check if this algorithm is available on this computer
             if algorithm not in hashlib.algorithms_available:
                 send_status_message(
@@ -203,9 +384,9 @@ def verify_hash(hash_to_check, wordlist_names, gui_callback=None, progress_callb
                 )
                 continue
 
-            # Create hasher object once for efficiency (instead of creating new ones for each password)
+            # Reuse the process-wide template (instead of creating new ones for each password or run)
             try:
-                hasher = hashlib.new(algorithm)
+                hasher = get_hasher_template(algorithm)
             except Exception as e:
                 send_status_message(
                     "",
@@ -220,149 +401,253 @@ def verify_hash(hash_to_check, wordlist_names, gui_callback=None, progress_callb
                 )
                 continue
 
-            # Try each wordlist
-            for wordlist_name in wordlist_names:
-                
-                # Check if we should stop early
-                if stop_event is not None and getattr(stop_event, "is_set", lambda: False)():
-                    was_stopped_early = True
-                    break
-                    
-                # Build the full path to the wordlist file
-                wordlist_path = os.path.join(WORDLISTS_FOLDER, wordlist_name)
-                
-                # Check if the wordlist file exists
-                if not os.path.isfile(wordlist_path):
-                    send_status_message(
-                        "",
-                        False,
-                        "#f00",
-                        [
-                            ("Wordlist not found: ", "#f00"),
-                            (wordlist_name, "#e6d9ff"),
-                        ]
-                    )
-                    continue
+            search_plan.append((hash_length, algorithm, hasher, target_digests))
 
-                send_status_message(
-                    "",
-                    False,
-                    "#fff",
-                    [
-                        ("Checking wordlist: ", "#fff"),
-                        (wordlist_name, "#e6d9ff"),
-                    ]
-                )
-                
+    # Passwords already hashed with every algorithm still in the plan
+    tested_passwords = set()
+    
+    # Look the stop check up once instead of a getattr (and a new lambda) per password
+    stop_requested = getattr(stop_event, "is_set", None) or (lambda: False)
+    
+    # Total number of hashes to find (hash_list never changes from here on)
+    target_count = len(hash_list)
+    
+    # Length groups whose last target was just found, waiting to be dropped
+    completed_groups = []
+    
+    # Large wordlists are split across processes while that keeps working
+    use_process_pool = PROCESS_POOL_WORKERS > 1
+    process_pool = None  # started with the first large wordlist of the run
+
+    def record_match(hash_length, algorithm, password, password_digest, target_digests):
+        """Store a found password; later algorithms needn't look for it again"""
+        found_passwords[password_digest.hex()] = (password.decode("utf-8", errors="replace"), algorithm)
+        target_digests.discard(password_digest)
+        if not target_digests:
+            completed_groups.append((hash_length, algorithm))
+
+    def drop_completed_groups(active):
+        """Announce finished length groups and take them out of the search"""
+        for hash_length, algorithm in completed_groups:
+            send_status_message(
+                "",
+                False,
+                "#0f0",
+                [
+                    ("[ ✓ ] Found all ", "#0f0"),
+                    (str(group_sizes[hash_length]), "#fff"),
+                    (" hashes for ", "#0f0"),
+                    (f"{hash_length}-char", "#fff"),
+                    (" length using ", "#0f0"),
+                    (algorithm, "#0ff"),
+                ]
+            )
+        done_lengths = {hash_length for hash_length, _ in completed_groups}
+        completed_groups.clear()
+        search_plan[:] = [entry for entry in search_plan if entry[0] not in done_lengths]
+        active[:] = [entry for entry in active if entry[0] not in done_lengths]
+
+    def send_progress(checked, total, wordlist_name, algorithm_names):
+        send_status_message(
+            "",
+            True,  # replace_last_line=True
+            "#fff",
+            [
+                (f"Checked {checked:,} / {total:,} passwords in ", "#fff"),
+                (wordlist_name, "#e6d9ff"),
+                (" using ", "#fff"),
+                (algorithm_names, "#0ff"),
+                ("...", "#fff"),
+            ]
+        )
+        
+        # Update the progress bar if we have a callback
+        if progress_callback:
+            progress_callback(checked, total)
+
+    # Read each wordlist once and hash every password with all algorithms
+    # (rather than re-reading the wordlist once per algorithm)
+    for wordlist_name, wordlist_path in wordlist_paths:
+        
+        # Nothing left to look for (every length group is complete)
+        if not search_plan:
+            break
+        
+        # Check if we should stop early
+        if stop_requested():
+            was_stopped_early = True
+            break
+
+        send_status_message(
+            "",
+            False,
+            "#fff",
+            [
+                ("Checking wordlist: ", "#fff"),
+                (wordlist_name, "#e6d9ff"),
+            ]
+        )
+        
+        try:
+            # Raw bytes lines: no per-line decode/encode, and only matches
+            # are ever turned into text
+            lines = load_wordlist_lines(wordlist_path)
+            total_lines = len(lines)
+            
+            # Bound once per wordlist: the loop below runs per password
+            active = [(hash_length, algorithm, hasher.copy, target_digests)
+                      for hash_length, algorithm, hasher, target_digests in search_plan]
+            algorithm_names = ", ".join(entry[1] for entry in active)
+            next_report = time.monotonic() + PROGRESS_REPORT_INTERVAL
+            searched = False
+            
+            if use_process_pool and total_lines * len(active) >= PARALLEL_MIN_HASHES:
                 try:
-                    # More efficient file processing - read in chunks and process line by line
-                    with open(wordlist_path, "r", encoding="utf-8", errors="ignore") as file:
-                        # Read all lines at once for better I/O performance with smaller files
-                        # For very large files, this could be modified to read in chunks
-                        lines = file.readlines()
-                        total_lines = len(lines)
+                    # Dedupe up front (keeping file order), as the worker
+                    # processes can't share tested_passwords
+                    new_passwords = [password for password in dict.fromkeys(line.strip() for line in lines)
+                                     if password and password not in tested_passwords]
+                    targets_by_length = {entry[0]: entry[3] for entry in active}
+                    search_specs = [(hash_length, algorithm, frozenset(target_digests))
+                                    for hash_length, algorithm, _, target_digests in active]
                     
-                    # Process each password
-                    for line_number, line in enumerate(lines, 1):
+                    if process_pool is None:
+                        process_pool = _create_process_pool()
+                    checked = 0
+                    for chunk_size, hits in _search_in_processes(process_pool, new_passwords, search_specs):
+                        checked += chunk_size
+                        for hash_length, algorithm, password, password_digest in hits:
+                            target_digests = targets_by_length[hash_length]
+                            if password_digest in target_digests:
+                                record_match(hash_length, algorithm, password, password_digest, target_digests)
                         
-                        # Check if we should stop early
-                        if stop_event is not None and getattr(stop_event, "is_set", lambda: False)():
-                            was_stopped_early = True
-                            break
+                        if completed_groups:
+                            drop_completed_groups(active)
+                            algorithm_names = ", ".join(entry[1] for entry in active)
                             
-                        # Get the password from this line
-                        password = line.strip()
-                        if not password:
-                            continue  # Skip empty lines
-                        
-                        # Skip passwords we've already tested (avoid duplicate work)
-                        password_key = f"{password}:{algorithm}"
-                        if password_key in tested_passwords:
-                            continue
-                        tested_passwords.add(password_key)
-                        
-                        # Hash this password with the current algorithm (using cached hasher)
-                        password_hash = create_hash(password, hasher)
-                        
-                        # Check if this hash matches any of our target hashes (O(1) lookup with set)
-                        if password_hash in hashes_in_group:
-                            # We found a match!
-                            found_passwords[password_hash] = (password, algorithm)
-                            found_in_group[hash_length] += 1
+                            # Check if we've found all hashes - if so, we can stop early! Only
+                            # a just-finished group can make that true, so it isn't checked per password
+                            if len(found_passwords) == target_count:
+                                send_status_message(f"🎉 All {target_count} hashes found! Stopping early for efficiency.")
+                                was_stopped_early = True
+                                break
+                            
+                            # Every remaining group is complete (only unusable hashes are left)
+                            if not active:
+                                break
                         
-                        # Check if we've found all hashes - if so, we can stop early!
-                        if len(found_passwords) == len(hash_list):
-                            send_status_message(f"🎉 All {len(hash_list)} hashes found! Stopping early for efficiency.")
+                        if stop_requested():
                             was_stopped_early = True
                             break
                         
-                        # Update progress every 1000 passwords
-                        if line_number % 1000 == 0:
-                            send_status_message(
-                                "",
-                                True,  # replace_last_line=True
-                                "#fff",
-                                [
-                                    (f"Checked {line_number:,} / {total_lines:,} passwords in ", "#fff"),
-                                    (wordlist_name, "#e6d9ff"),
-                                    (" using ", "#fff"),
-                                    (algorithm, "#0ff"),
-                                    ("...", "#fff"),
-                                ]
-                            )
-                            
-                            # Update the progress bar if we have a callback
-                            if progress_callback:
-                                progress_callback(line_number, total_lines)
-                                    
-                except Exception as error:
+                        if time.monotonic() >= next_report:
+                            next_report = time.monotonic() + PROGRESS_REPORT_INTERVAL
+                            # Scale to lines, so the total matches the serial
+                            # path and the final 100% report
+                            send_progress(checked * total_lines // len(new_passwords), total_lines,
+                                          wordlist_name, algorithm_names)
+                    
+                    tested_passwords.update(new_passwords)
+                    searched = True
+                    
+                except (OSError, RuntimeError) as error:
+                    # e.g. no semaphores in a sandbox, or a worker was killed;
+                    # search this wordlist (and the rest) in this process
+                    use_process_pool = False
+                    if process_pool is not None:
+                        process_pool.shutdown(wait=False, cancel_futures=True)
+                        process_pool = None
                     send_status_message(
                         "",
                         False,
-                        "#f00",
+                        "#ff0",
                         [
-                            ("Error reading ", "#f00"),
-                            (wordlist_name, "#e6d9ff"),
-                            (": ", "#f00"),
-                            (str(error), "#f00"),
+                            ("Parallel search unavailable, using one core: ", "#ff0"),
+                            (str(error), "#fff"),
                         ]
                     )
+            
+            # Otherwise process each password here
+            if not searched:
+                for line_number, line in enumerate(lines, 1):
                 
-                # If we found all hashes or stopped early, break out of wordlist loop
-                if was_stopped_early:
-                    break
-                
-                # Skip remaining wordlists for this algorithm if we found all hashes in this length group
-                if found_in_group[hash_length] == len(hashes_in_group):
-                    send_status_message(
-                        "",
-                        False,
-                        "#0f0",
-                        [
-                            ("[ ✓ ] Found all ", "#0f0"),
-                            (str(len(hashes_in_group)), "#fff"),
-                            (" hashes for ", "#0f0"),
-                            (f"{hash_length}-char", "#fff"),
-                            (" length using ", "#0f0"),
-                            (algorithm, "#0ff"),
-                        ]
-                    )
-                    break
+                    # Check if we should stop early (every 1024 lines is plenty
+                    # for a Stop button, and much cheaper than every password)
+                    if line_number & 0x3FF == 0 and stop_requested():
+                        was_stopped_early = True
+                        break
+                    
+                    # Update progress at most ~15 times a second, however fast the
+                    # hash (before the skips below, so no report is ever lost)
+                    if line_number & 0xFFF == 0 and time.monotonic() >= next_report:
+                        next_report = time.monotonic() + PROGRESS_REPORT_INTERVAL
+                        send_progress(line_number, total_lines, wordlist_name, algorithm_names)
                     
-            # If we found all hashes or stopped early, break out of algorithm loop too
-            if was_stopped_early:
-                break
+                    # Get the password from this line
+                    password = line.strip()
+                    if not password:
+                        continue  # Skip empty lines
                 
-            # Skip remaining algorithms if we found all hashes in this length group
-            if found_in_group[hash_length] == len(hashes_in_group):
-                break
+                    # Skip passwords we've already tested (avoid duplicate work)
+                    if password in tested_passwords:
+                        continue
+                    tested_passwords.add(password)
+                
+                    for hash_length, algorithm, new_hasher, target_digests in active:
+                        # Hash this password with the current algorithm (copying the
+                        # cached hasher like create_hash does, minus the call)
+                        password_hasher = new_hasher()
+                        password_hasher.update(password)
+                        password_digest = password_hasher.digest()
+                    
+                        # Check if this hash matches any of our target hashes (O(1) lookup with set)
+                        if password_digest in target_digests:
+                            # We found a match!
+                            record_match(hash_length, algorithm, password, password_digest, target_digests)
                 
-        # Add a blank line for readability
-        send_status_message("")
+                    # Drop length groups whose hashes have all been found
+                    if completed_groups:
+                        drop_completed_groups(active)
+                        algorithm_names = ", ".join(entry[1] for entry in active)
+                        
+                        # Check if we've found all hashes - if so, we can stop early! Only
+                        # a just-finished group can make that true, so it isn't checked per password
+                        if len(found_passwords) == target_count:
+                            send_status_message(f"🎉 All {target_count} hashes found! Stopping early for efficiency.")
+                            was_stopped_early = True
+                            break
+                        
+                        # Every remaining group is complete (only unusable hashes are left)
+                        if not active:
+                            break
+            
+            # Always finish a fully searched wordlist at 100%
+            if not was_stopped_early:
+                send_progress(total_lines, total_lines, wordlist_name, algorithm_names)
+                            
+        except Exception as error:
+            send_status_message(
+                "",
+                False,
+                "#f00",
+                [
+                    ("Error reading ", "#f00"),
+                    (wordlist_name, "#e6d9ff"),
+                    (": ", "#f00"),
+                    (str(error), "#f00"),
+                ]
+            )
         
-        # If we stopped early, break out of length loop too
+        # If we found all hashes or stopped early, break out of wordlist loop
         if was_stopped_early:
             break
+    
+    # Let chunks still running finish in the background; nothing new starts
+    if process_pool is not None:
+        process_pool.shutdown(wait=False, cancel_futures=True)
+            
+    # Add a blank line for readability
+    send_status_message("")
 
     # Show results
     if found_passwords:
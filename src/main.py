@@ -17,24 +17,28 @@ Perfect for:
 """
 
 # Import the modules we need
+import multiprocessing
 import os
 import sys
-import tkinter as tk
-from tkinter import messagebox
-from tkinterdnd2 import TkinterDnD
 
 # Add the src directory to the path so imports work correctly
 sys.path.insert(0, os.path.dirname(__file__))
 
-from gui import HashVerifierGUI
+# The hash search's worker processes start by running this file again (as
+# "__mp_main__", or through freeze_support() in the bundled app). They only
+# need hash_verifier, so the GUI modules are imported inside the functions
+# below that use them rather than at the top of this file.
+if __name__ == "__main__":
+    # In a bundled worker process this runs the worker and never returns
+    multiprocessing.freeze_support()
 
-# Special code to make the app look better on Windows high-DPI screens
-if sys.platform.startswith('win'):
-    try:
-        from ctypes import windll
-        windll.shcore.SetProcessDpiAwareness(1)
-    except Exception:
-        pass  # If this fails, just continue without high-DPI support
+    # Special code to make the app look better on Windows high-DPI screens
+    if sys.platform.startswith('win'):
+        try:
+            from ctypes import windll
+            windll.shcore.SetProcessDpiAwareness(1)
+        except Exception:
+            pass  # If this fails, just continue without high-DPI support
 
 
 def setup_main_window():
@@ -44,6 +48,9 @@ def setup_main_window():
     Returns:
         tk.Tk: The configured main window
     """
+    import tkinter as tk
+    from tkinterdnd2 import TkinterDnD
+    
     # Create the main window
     root = TkinterDnD.Tk()
     root.title("PASS // FAIL")
@@ -85,7 +92,11 @@ def main():
     The main function that starts the application.
     This is what runs when you start the program.
     """
+    from tkinter import messagebox
+    
     try:
+        from gui import HashVerifierGUI
+        
         # Create the main window
         root = setup_main_window()
         